@@ -23,13 +23,32 @@ Indexed Grammar
     Indexed Grammar
 rsa
     Recursive automaton
+fcfg
+    Feature Context-Free Grammar
 
 """
 
-__all__ = ["finite_automaton",
+__all__ = ("finite_automaton",
            "regular_expression",
            "cfg",
            "fst",
            "indexed_grammar",
            "pda",
-           "rsa"]
+           "rsa",
+           "fcfg")
+
+
+def __getattr__(name):
+    """ Imports the subpackages on first access """
+    if name in __all__:
+        # pylint: disable=import-outside-toplevel
+        import importlib
+        module = importlib.import_module("." + name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError("module " + repr(__name__) + " has no attribute " +
+                         repr(name))
+
+
+def __dir__():
+    return sorted(set(globals()).union(__all__))
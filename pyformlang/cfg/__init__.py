@@ -11,25 +11,39 @@ CFG
     The main context-free grammar class
 Production
     A class to represent a production in a CFG
+CFGObject
+    The base class of the symbols of a CFG
 Variable
     A context-free grammar variable
 Terminal
     A context-free grammar terminal
 Epsilon
     The epsilon symbol (special terminal)
+ParseTree
+    A parse tree of a word
+LLOneParser
+    A LL(1) parser
+DerivationDoesNotExist
+    Raised when a word cannot be derived by a grammar
 
 """
 
+from .cfg_object import CFGObject
 from .variable import Variable
 from .terminal import Terminal
 from .production import Production
 from .cfg import CFG
 from .epsilon import Epsilon
+from .parse_tree import ParseTree
+from .cyk_table import DerivationDoesNotExist
 from .llone_parser import LLOneParser
 
-__all__ = ["Variable",
+__all__ = ("CFGObject",
+           "Variable",
            "Terminal",
            "Production",
            "CFG",
            "Epsilon",
-           "LLOneParser"]
+           "ParseTree",
+           "LLOneParser",
+           "DerivationDoesNotExist")
@@ -1,9 +1,9 @@
 """ A context free grammar """
+import re
 import string
-from copy import deepcopy
-from typing import AbstractSet, Iterable, Tuple, Dict, Any, Union
-
-import networkx as nx
+from collections import defaultdict
+from typing import AbstractSet, Iterable, Tuple, Dict, Any, Union, List, \
+    Set, Callable, Iterator
 
 # pylint: disable=cyclic-import
 from pyformlang import pda
@@ -18,14 +18,24 @@ from .epsilon import Epsilon
 from .pda_object_creator import PDAObjectCreator
 from .production import Production
 from .terminal import Terminal
-from .utils import to_variable, to_terminal
+from .utils import to_variable, to_terminal, to_terminal_word
 from .utils_cfg import remove_nullable_production, get_productions_d
 from .variable import Variable
 
 EPSILON_SYMBOLS = ["epsilon", "$", "ε", "ϵ", "Є"]
+# The same texts, for constant time lookups when reading a text
+EPSILON_TEXTS = frozenset(EPSILON_SYMBOLS)
+# The first characters of the symbols read as variables without an explicit
+# type
+VARIABLE_FIRST_CHARACTERS = frozenset(string.ascii_uppercase)
 
 SUBS_SUFFIX = "#SUBS#"
 
+# The separators and symbols of the bodies of the text representation, a
+# symbol with an explicit type being given by its type and its name
+BODY_TOKEN = re.compile(
+    r'(\|)|"(VAR|TER):([^\s|]+)"(?=[\s|]|$)|([^\s|]+)')
+
 
 class NotParsableException(Exception):
     """When the grammar cannot be parsed (parser not powerful enough)"""
@@ -75,22 +85,30 @@ class CFG:
             self._variables.add(start_symbol)
         self._productions = productions or set()
         self._productions = self._productions
+        # The symbols of the bodies are added according to their kind
+        add_by_kind = {"T": self._terminals.add,
+                       "E": self._terminals.add,
+                       "V": self._variables.add}
         for production in self._productions:
-            self.__initialize_production_in_cfg(production)
+            self.__initialize_production_in_cfg(production, add_by_kind)
         self._normal_form = None
         self._generating_symbols = None
         self._nullable_symbols = None
+        self._reachable_symbols = None
+        self._unit_pairs = None
+        self._generate_epsilon = None
         self._impacts = None
+        self._impacted_heads = None
         self._remaining_lists = None
         self._added_impacts = None
+        self._productions_by_head = None
 
-    def __initialize_production_in_cfg(self, production):
+    def __initialize_production_in_cfg(
+            self, production: Production,
+            add_by_kind: Dict[str, Callable[[CFGObject], None]]) -> None:
         self._variables.add(production.head)
         for cfg_object in production.body:
-            if isinstance(cfg_object, Terminal):
-                self._terminals.add(cfg_object)
-            else:
-                self._variables.add(cfg_object)
+            add_by_kind[cfg_object.kind](cfg_object)
 
     def get_generating_symbols(self) -> AbstractSet[CFGObject]:
         """ Gives the objects which are generating in the CFG
@@ -104,7 +122,8 @@ class CFG:
             self._generating_symbols = self._get_generating_or_nullable(False)
         return self._generating_symbols
 
-    def _get_generating_or_nullable(self, nullable=False):
+    def _get_generating_or_nullable(self, nullable: bool = False) \
+            -> Set[CFGObject]:
         """ Merge of nullable and generating """
         to_process = [Epsilon()]
         g_symbols = {Epsilon()}
@@ -121,29 +140,33 @@ class CFG:
                 g_symbols.add(terminal)
                 to_process.append(terminal)
 
-        processed_with_modification = []
+        # The lookups are bound once, out of the worklist loop
+        get_impacts = self._impacts.get
+        impacted_heads = self._impacted_heads
+        # The counters are decremented on a scratch copy, so the shared
+        # ones never need to be restored
+        remaining_lists = self._remaining_lists.copy()
         while to_process:
             current = to_process.pop()
-            for symbol_impact, index_impact in self._impacts.get(current, []):
+            for index_impact in get_impacts(current, ()):
+                symbol_impact = impacted_heads[index_impact]
                 if symbol_impact in g_symbols:
                     continue
-                processed_with_modification.append(
-                    (symbol_impact, index_impact))
-                self._remaining_lists[symbol_impact][index_impact] -= 1
-                if self._remaining_lists[symbol_impact][index_impact] == 0:
+                remaining_lists[index_impact] -= 1
+                if remaining_lists[index_impact] == 0:
                     g_symbols.add(symbol_impact)
                     to_process.append(symbol_impact)
-        # Fix modifications
-        for symbol_impact, index_impact in processed_with_modification:
-            self._remaining_lists[symbol_impact][index_impact] += 1
         g_symbols.remove(Epsilon())
         return g_symbols
 
-    def _set_impacts_and_remaining_lists(self):
+    def _set_impacts_and_remaining_lists(self) -> None:
         if self._impacts is not None:
             return
+        # The productions with a non-empty body are identified by their
+        # index in _remaining_lists and _impacted_heads
         self._added_impacts = set()
-        self._remaining_lists = {}
+        self._remaining_lists = []
+        self._impacted_heads = []
         self._impacts = {}
         for production in self._productions:
             head = production.head  # Should check if head is not Epsilon?
@@ -151,14 +174,13 @@ class CFG:
             if not body:
                 self._added_impacts.add(head)
                 continue
-            temp = self._remaining_lists.setdefault(head, [])
-            temp.append(len(body))
-            index_impact = len(temp) - 1
+            index_impact = len(self._remaining_lists)
+            self._remaining_lists.append(len(body))
+            self._impacted_heads.append(head)
             for symbol in body:
-                self._impacts.setdefault(symbol, []).append(
-                    (head, index_impact))
+                self._impacts.setdefault(symbol, []).append(index_impact)
 
-    def generate_epsilon(self):
+    def generate_epsilon(self) -> bool:
         """ Whether the grammar generates epsilon or not
 
         Returns
@@ -166,31 +188,56 @@ class CFG:
         generate_epsilon : bool
             Whether epsilon is generated or not by the CFG
         """
-        generate_epsilon = {Epsilon()}
-        to_process = [Epsilon()]
+        if self._generate_epsilon is None:
+            if self._nullable_symbols is not None:
+                self._generate_epsilon = \
+                    self._start_symbol in self._nullable_symbols
+            else:
+                self._generate_epsilon = self._get_generate_epsilon()
+        return self._generate_epsilon
 
+    def _get_generate_epsilon(self) -> bool:
+        """ Stops the nullable computation once the start symbol is found """
+        return self._is_generating_or_nullable(self._start_symbol, True)
+
+    def _is_generating_or_nullable(self, target: CFGObject,
+                                   nullable: bool = False) -> bool:
+        """ Whether the target is generating (or nullable), stopping as \
+        soon as it is found """
         self._set_impacts_and_remaining_lists()
 
+        g_symbols = {Epsilon()}
+        to_process = [Epsilon()]
         for symbol in self._added_impacts:
-            if symbol == self._start_symbol:
+            if symbol == target:
                 return True
-            if symbol not in generate_epsilon:
-                generate_epsilon.add(symbol)
+            if symbol not in g_symbols:
+                g_symbols.add(symbol)
                 to_process.append(symbol)
+        if not nullable:
+            for terminal in self._terminals:
+                g_symbols.add(terminal)
+                to_process.append(terminal)
+        # Only the counters which are touched are copied, in a sparse
+        # dictionary, so an early return does not pay for a full copy
         remaining_lists = self._remaining_lists
-        impacts = self._impacts
-        remaining_lists = deepcopy(remaining_lists)
+        decremented = {}
+        get_impacts = self._impacts.get
+        impacted_heads = self._impacted_heads
 
         while to_process:
             current = to_process.pop()
-            for symbol_impact, index_impact in impacts.get(current, []):
-                if symbol_impact in generate_epsilon:
+            for index_impact in get_impacts(current, ()):
+                symbol_impact = impacted_heads[index_impact]
+                if symbol_impact in g_symbols:
                     continue
-                remaining_lists[symbol_impact][index_impact] -= 1
-                if remaining_lists[symbol_impact][index_impact] == 0:
-                    if symbol_impact == self._start_symbol:
+                remaining = decremented.get(
+                    index_impact, remaining_lists[index_impact]) - 1
+                decremented[index_impact] = remaining
+                if remaining == 0:
+                    if symbol_impact == target:
                         return True
-                    generate_epsilon.add(symbol_impact)
+                    g_symbols.add(symbol_impact)
                     to_process.append(symbol_impact)
         return False
 
@@ -202,15 +249,32 @@ class CFG:
         reachable_symbols : set of :class:`~pyformlang.cfg.CFGObject`
             The reachable symbols of the CFG
         """
+        if self._reachable_symbols is None:
+            self._reachable_symbols = self._get_reachable_symbols()
+        return self._reachable_symbols
+
+    def _get_reachable_symbols(self) -> Set[CFGObject]:
+        return self._get_reachable_from(self._start_symbol,
+                                        self._productions)
+
+    @staticmethod
+    def _get_reachable_from(start_symbol: Variable,
+                            productions: Iterable[Production]) \
+            -> Set[CFGObject]:
+        """ Gives the symbols reachable from the start symbol using the \
+        given productions """
         r_symbols = set()
-        r_symbols.add(self._start_symbol)
+        r_symbols.add(start_symbol)
+        # The bodies are flattened by head, so that each edge is followed
+        # only once and the epsilons are filtered once per head
         reachable_transition_d = {}
-        for production in self._productions:
-            temp = reachable_transition_d.setdefault(production.head, [])
-            for symbol in production.body:
-                if not isinstance(symbol, Epsilon):
-                    temp.append(symbol)
-        to_process = [self._start_symbol]
+        for production in productions:
+            reachable_transition_d.setdefault(production.head, set()).update(
+                production.body)
+        epsilon = Epsilon()
+        for next_symbols in reachable_transition_d.values():
+            next_symbols.discard(epsilon)
+        to_process = [start_symbol]
         while to_process:
             current = to_process.pop()
             for next_symbol in reachable_transition_d.get(current, []):
@@ -233,8 +297,10 @@ class CFG:
                        all(y in generating for y in x.body)]
         new_var = self._variables.intersection(generating)
         new_ter = self._terminals.intersection(generating)
-        cfg_temp = CFG(new_var, new_ter, self._start_symbol, productions)
-        reachables = cfg_temp.get_reachable_symbols()
+        # The reachability is computed on the generating productions
+        # directly, without building an intermediate CFG
+        reachables = self._get_reachable_from(self._start_symbol,
+                                              productions)
         productions = [x for x in productions
                        if x.head in reachables]
         new_var = new_var.intersection(reachables)
@@ -271,6 +337,26 @@ class CFG:
                    self._start_symbol,
                    new_productions)
 
+    def get_productions_by_head(self) -> Dict[Variable, List[Production]]:
+        """ Gives the productions of the CFG grouped by head
+
+        Returns
+        ----------
+        productions_by_head : dict of :class:`~pyformlang.cfg.Variable` to \
+        list of :class:`~pyformlang.cfg.Production`
+            The productions of each head
+        """
+        return {head: list(productions)
+                for head, productions
+                in self._get_productions_by_head().items()}
+
+    def _get_productions_by_head(self) -> Dict[Variable, List[Production]]:
+        """ Gives the productions grouped by head, shared by the parsers \
+        which must not modify them """
+        if self._productions_by_head is None:
+            self._productions_by_head = get_productions_d(self._productions)
+        return self._productions_by_head
+
     def get_unit_pairs(self) -> AbstractSet[Tuple[Variable, Variable]]:
         """ Finds all the unit pairs
 
@@ -279,21 +365,31 @@ class CFG:
         unit_pairs : set of tuple of :class:`~pyformlang.cfg.Variable`
             The unit pairs
         """
-        unit_pairs = set()
-        for variable in self._variables:
-            unit_pairs.add((variable, variable))
+        if self._unit_pairs is None:
+            self._unit_pairs = self._get_unit_pairs()
+        return self._unit_pairs
+
+    def _get_unit_pairs(self) -> Set[Tuple[Variable, Variable]]:
         productions = [x
                        for x in self._productions
-                       if len(x.body) == 1 and isinstance(x.body[0], Variable)]
+                       if len(x.body) == 1 and x.body[0].kind == "V"]
         productions_d = get_productions_d(productions)
-        to_process = list(unit_pairs)
-        while to_process:
-            var_a, var_b = to_process.pop()
-            for production in productions_d.get(var_b, []):
-                temp = (var_a, production.body[0])
-                if temp not in unit_pairs:
-                    unit_pairs.add(temp)
-                    to_process.append(temp)
+        # The variables without unit productions only give (v, v)
+        unit_pairs = {(variable, variable) for variable in self._variables
+                      if variable not in productions_d}
+        # One traversal of the unit productions per head of unit production
+        for variable in productions_d:
+            reachables = {variable}
+            to_process = [variable]
+            while to_process:
+                current = to_process.pop()
+                for production in productions_d.get(current, []):
+                    next_variable = production.body[0]
+                    if next_variable not in reachables:
+                        reachables.add(next_variable)
+                        to_process.append(next_variable)
+            unit_pairs.update((variable, reachable)
+                              for reachable in reachables)
         return unit_pairs
 
     def eliminate_unit_productions(self) -> "CFG":
@@ -307,8 +403,7 @@ class CFG:
         unit_pairs = self.get_unit_pairs()
         productions = [x
                        for x in self._productions
-                       if len(x.body) != 1
-                       or not isinstance(x.body[0], Variable)]
+                       if len(x.body) != 1 or x.body[0].kind != "V"]
         productions_d = get_productions_d(productions)
         for var_a, var_b in unit_pairs:
             for production in productions_d.get(var_b, []):
@@ -319,70 +414,89 @@ class CFG:
                    self._start_symbol,
                    productions)
 
-    def _get_productions_with_only_single_terminals(self):
+    def _get_productions_with_only_single_terminals(self) \
+            -> Iterator[Production]:
         """ Remove the terminals involved in a body of length more than 1 """
+        # The variables are only created for the terminals which are used in
+        # a body of length more than 1
         term_to_var = {}
-        new_productions = []
-        for terminal in self._terminals:
-            var = Variable(str(terminal.value) + "#CNF#")
-            term_to_var[terminal] = var
-        # We want to add only the useful productions
-        used = set()
         for production in self._productions:
             if len(production.body) == 1:
-                new_productions.append(production)
+                yield production
                 continue
             new_body = []
             for symbol in production.body:
-                if symbol in term_to_var:
-                    new_body.append(term_to_var[symbol])
-                    used.add(symbol)
+                if isinstance(symbol, Terminal):
+                    var = term_to_var.get(symbol)
+                    if var is None:
+                        var = Variable(str(symbol.value) + "#CNF#")
+                        term_to_var[symbol] = var
+                    new_body.append(var)
                 else:
                     new_body.append(symbol)
-            new_productions.append(Production(production.head,
-                                              new_body))
-        for terminal in used:
-            new_productions.append(
-                Production(term_to_var[terminal], [terminal]))
-        return new_productions
-
-    def _get_next_free_variable(self, idx, prefix):
+            yield Production(production.head, new_body)
+        for terminal, var in term_to_var.items():
+            yield Production(var, [terminal])
+
+    def _get_taken_suffixes(self, prefix: str) -> Set[str]:
+        """ Gives the suffixes of the variables starting with the prefix """
+        return {variable.value[len(prefix):]
+                for variable in self._variables
+                if isinstance(variable.value, str)
+                and variable.value.startswith(prefix)}
+
+    @staticmethod
+    def _get_next_free_variable(idx: int, prefix: str,
+                                taken_suffixes: AbstractSet[str]) \
+            -> Tuple[int, Variable]:
         idx += 1
-        temp = Variable(prefix + str(idx))
-        while temp in self._variables:
+        # The existing variables are probed by suffix, without creating a
+        # variable for each candidate
+        while str(idx) in taken_suffixes:
             idx += 1
-            temp = Variable(prefix + str(idx))
-        return idx, temp
+        return idx, Variable(prefix + str(idx))
 
-    def _decompose_productions(self, productions):
+    def _decompose_productions(self, productions: Iterable[Production]) \
+            -> Iterator[Production]:
         """ Decompose productions """
         idx = 0
-        new_productions = []
         done = {}
+        # The suffixes of the bodies are memoized as tuples of integers,
+        # which are much cheaper to hash and compare than the symbols
+        symbol_ids = {}
+        taken_suffixes = self._get_taken_suffixes("C#CNF#")
         for production in productions:
             body = production.body
             if len(body) <= 2:
-                new_productions.append(production)
+                yield production
                 continue
             new_var = []
             for _ in range(len(body) - 2):
-                idx, var = self._get_next_free_variable(idx, "C#CNF#")
+                idx, var = self._get_next_free_variable(idx, "C#CNF#",
+                                                        taken_suffixes)
                 new_var.append(var)
+            body_ids = [symbol_ids.setdefault(symbol, len(symbol_ids))
+                        for symbol in body]
+            # The suffixes are built right to left, one element at a time
+            suffix = (body_ids[-1],)
+            suffixes = []
+            for i in range(len(body) - 3, -1, -1):
+                suffix = (body_ids[i + 1],) + suffix
+                suffixes.append(suffix)
+            suffixes.reverse()
             head = production.head
             stopped = False
             for i in range(len(body) - 2):
-                temp = tuple(body[i + 1:])
+                temp = suffixes[i]
                 if temp in done:
-                    new_productions.append(Production(head,
-                                                      [body[i], done[temp]]))
+                    yield Production(head, [body[i], done[temp]])
                     stopped = True
                     break
-                new_productions.append(Production(head, [body[i], new_var[i]]))
+                yield Production(head, [body[i], new_var[i]])
                 done[temp] = new_var[i]
                 head = new_var[i]
             if not stopped:
-                new_productions.append(Production(head, [body[-2], body[-1]]))
-        return new_productions
+                yield Production(head, [body[-2], body[-1]])
 
     def to_normal_form(self) -> "CFG":
         """ Gets the Chomsky Normal Form of a CFG
@@ -390,7 +504,8 @@ class CFG:
         Returns
         ----------
         new_cfg : :class:`~pyformlang.cfg.CFG`
-            A new CFG equivalent in the CNF form
+            A new CFG equivalent in the CNF form, or the CFG itself when it \
+            is already in CNF without useless symbols
 
         Warnings
         ---------
@@ -420,14 +535,36 @@ class CFG:
                 .remove_useless_symbols() \
                 .eliminate_unit_productions() \
                 .remove_useless_symbols()
-            cfg = new_cfg.to_normal_form()
+            # The transformations leave no nullable, unit or useless
+            # symbols, so the analyses are not run again on the new CFG
+            # pylint: disable=protected-access
+            cfg = new_cfg._get_normal_form_of_clean_cfg()
             self._normal_form = cfg
             return cfg
-        # Remove terminals from body
-        new_productions = self._get_productions_with_only_single_terminals()
-        new_productions = self._decompose_productions(new_productions)
+        return self._get_normal_form_of_clean_cfg()
+
+    def _get_normal_form_of_clean_cfg(self) -> "CFG":
+        """ Gets the normal form of a CFG without nullable, unit or useless \
+        symbols """
+        if self.is_normal_form():
+            # A clean CFG already in normal form is its own normal form,
+            # unless some of its productions are repeated
+            new_productions = set(self._productions)
+            if len(new_productions) == len(self._productions):
+                self._normal_form = self
+                return self
+        else:
+            # Remove terminals from body
+            # The productions are streamed from one step to the other and
+            # only stored in the final set
+            new_productions = set(self._decompose_productions(
+                self._get_productions_with_only_single_terminals()))
         cfg = CFG(start_symbol=self._start_symbol,
-                  productions=set(new_productions))
+                  productions=new_productions)
+        # The result is clean and in normal form, so it is its own normal
+        # form and it does not need to be analysed again
+        # pylint: disable=protected-access
+        cfg._normal_form = cfg
         self._normal_form = cfg
         return cfg
 
@@ -508,27 +645,24 @@ class CFG:
                 new_vars.add(temp)
                 idx += 1
             # Add rules of the new cfg
+            get_local = new_variables_d_local.get
             for production in cfg.productions:
-                body = []
-                for cfgobj in production.body:
-                    if cfgobj in new_variables_d_local:
-                        body.append(new_variables_d_local[cfgobj])
-                    else:
-                        body.append(cfgobj)
+                body = [get_local(cfgobj, cfgobj)
+                        for cfgobj in production.body]
                 productions.append(
                     Production(new_variables_d_local[production.head],
                                body))
             final_replacement[ter] = new_variables_d_local[cfg.start_symbol]
             terminals = terminals.union(cfg.terminals)
+        # A single mapping is looked up per symbol, the variables taking
+        # precedence over the substituted terminals
+        remap = dict(new_variables_d)
+        for ter, replacement in final_replacement.items():
+            if ter not in remap:
+                remap[ter] = replacement
+        get_remap = remap.get
         for production in self._productions:
-            body = []
-            for cfgobj in production.body:
-                if cfgobj in new_variables_d:
-                    body.append(new_variables_d[cfgobj])
-                elif cfgobj in final_replacement:
-                    body.append(final_replacement[cfgobj])
-                else:
-                    body.append(cfgobj)
+            body = [get_remap(cfgobj, cfgobj) for cfgobj in production.body]
             productions.append(Production(new_variables_d[production.head],
                                           body))
         return CFG(new_vars, None, new_variables_d[self._start_symbol],
@@ -672,8 +806,14 @@ class CFG:
         """
         productions = []
         for production in self._productions:
+            # A body of length at most 1 is its own reverse
+            if len(production.body) <= 1:
+                productions.append(production)
+                continue
+            # The body was already filtered when the production was created
             productions.append(Production(production.head,
-                                          production.body[::-1]))
+                                          production.body[::-1],
+                                          filtering=False))
         return CFG(self.variables,
                    self.terminals,
                    self.start_symbol,
@@ -696,12 +836,11 @@ class CFG:
         ----------
         is_empty : bool
             Whether the CFG is empty or not
-
-        TODO
-        ----------
-        Can be optimized
         """
-        return self._start_symbol not in self.get_generating_symbols()
+        if self._generating_symbols is not None:
+            return self._start_symbol not in self._generating_symbols
+        # The computation stops as soon as the start symbol is generating
+        return not self._is_generating_or_nullable(self._start_symbol)
 
     def __bool__(self):
         return not self.is_empty()
@@ -723,7 +862,7 @@ class CFG:
             Whether word if in the CFG or not
         """
         # Remove epsilons
-        word = [to_terminal(x) for x in word if x != Epsilon()]
+        word = to_terminal_word(word)
         if not word:
             return self.generate_epsilon()
         cyk_table = CYKTable(self, word)
@@ -744,7 +883,7 @@ class CFG:
             The parse tree
 
         """
-        word = [to_terminal(x) for x in word if x != Epsilon()]
+        word = to_terminal_word(word)
         if not word and not self.generate_epsilon():
             raise DerivationDoesNotExist
         cyk_table = CYKTable(self, word)
@@ -824,6 +963,11 @@ class CFG:
         states = list(other.states)
         cv_converter = \
             cvc.CFGVariableConverter(states, cfg.variables)
+        # The transitions are read once, grouped by the value of their symbol
+        transitions_by_value = {}
+        for state_from, symbol, state_to in other:
+            transitions_by_value.setdefault(symbol.value, {})[state_from] = \
+                state_to
         new_productions = []
         for production in cfg.productions:
             if len(production.body) == 2:
@@ -831,10 +975,9 @@ class CFG:
                     production, states, cv_converter)
             else:
                 new_productions += self._intersection_when_terminal(
-                    other,
+                    transitions_by_value,
                     production,
-                    cv_converter,
-                    states)
+                    cv_converter)
         new_productions += self._intersection_starting_rules(cfg,
                                                              other,
                                                              cv_converter)
@@ -860,50 +1003,44 @@ class CFG:
         return productions_temp
 
     @staticmethod
-    def _intersection_when_terminal(other_fst, production,
-                                    cv_converter, states):
+    def _intersection_when_terminal(transitions_by_value, production,
+                                    cv_converter):
         productions_temp = []
-        for state_p in states:
-            next_states = other_fst(state_p, production.body[0].value)
-            if next_states:
-                new_head = \
-                    cv_converter.to_cfg_combined_variable(
-                        state_p, production.head, next_states[0])
-                productions_temp.append(
-                    Production(new_head,
-                               [production.body[0]],
-                               filtering=False))
+        transitions = transitions_by_value.get(production.body[0].value, {})
+        for state_p, next_state in transitions.items():
+            new_head = \
+                cv_converter.to_cfg_combined_variable(
+                    state_p, production.head, next_state)
+            productions_temp.append(
+                Production(new_head,
+                           [production.body[0]],
+                           filtering=False))
         return productions_temp
 
     @staticmethod
     def _intersection_when_two_non_terminals(production, states,
                                              cv_converter):
+        # The combined variables only depend on two states, so they are
+        # computed once for all the pairs instead of for all the triples
+        to_combined = cv_converter.to_cfg_combined_variable
+        head, left, right = production.head, production.body[0], \
+            production.body[1]
+        lefts = [[to_combined(state_p, left, state_q) for state_q in states]
+                 for state_p in states]
+        rights = [[to_combined(state_q, right, state_r)
+                   for state_r in states]
+                  for state_q in states]
         productions_temp = []
-        for state_p in states:
-            for state_r in states:
-                bodies = CFG._get_all_bodies(production,
-                                             state_p, state_r,
-                                             states, cv_converter)
-                new_head = \
-                    cv_converter.to_cfg_combined_variable(
-                        state_p, production.head, state_r)
-                productions_temp += [Production(new_head,
-                                                body,
-                                                filtering=False)
-                                     for body in bodies]
+        for state_p, lefts_p in zip(states, lefts):
+            for i_r, state_r in enumerate(states):
+                new_head = to_combined(state_p, head, state_r)
+                productions_temp += [
+                    Production(new_head,
+                               [left_pq, rights_q[i_r]],
+                               filtering=False)
+                    for left_pq, rights_q in zip(lefts_p, rights)]
         return productions_temp
 
-    @staticmethod
-    def _get_all_bodies(production, state_p, state_r, states, cv_converter):
-        return [
-            [cv_converter.to_cfg_combined_variable(state_p,
-                                                   production.body[0],
-                                                   state_q),
-             cv_converter.to_cfg_combined_variable(state_q,
-                                                   production.body[1],
-                                                   state_r)]
-            for state_q in states]
-
     def __and__(self, other):
         """ Gives the intersection of the current CFG with an other object
 
@@ -930,63 +1067,90 @@ class CFG:
         max_length : int
             The maximum length of the words to return
         """
-        nullables = self.get_nullable_symbols()
-        if self.start_symbol in nullables:
+        if self.start_symbol in self.get_nullable_symbols():
             yield []
         if max_length == 0:
             return
         cfg = self.to_normal_form()
-        productions = cfg.productions
-        gen_d = {}
-        # Look for Epsilon Transitions
-        for production in productions:
-            if production.head not in gen_d:
-                gen_d[production.head] = [[]]
-            if len(production.body) == 2:
-                for obj in production.body:
-                    if obj not in gen_d:
-                        gen_d[obj] = [[]]
-        # To a single terminal
-        for production in productions:
-            body = production.body
-            if len(body) == 1:
-                if len(gen_d[production.head]) == 1:
-                    gen_d[production.head].append([])
-                if body not in gen_d[production.head][-1]:
-                    gen_d[production.head][-1].append(list(body))
-                    if production.head == cfg.start_symbol:
-                        yield list(body)
-        # Complete what is missing
-        current_length = 2
-        total_no_modification = 0
-        while current_length <= max_length or max_length == -1:
-            was_modified = False
-            for gen in gen_d.values():
-                if len(gen) != current_length:
-                    gen.append([])
-            for production in productions:
-                body = production.body
-                if len(gen_d[production.head]) != current_length + 1:
-                    gen_d[production.head].append([])
-                if len(body) != 2:
-                    continue
-                for i in range(1, current_length):
-                    j = current_length - i
-                    for left in gen_d[body[0]][i]:
-                        for right in gen_d[body[1]][j]:
-                            new_word = left + right
-                            if new_word not in gen_d[production.head][-1]:
-                                was_modified = True
-                                gen_d[production.head][-1].append(new_word)
-                                if production.head == cfg.start_symbol:
-                                    yield new_word
-            if was_modified:
-                total_no_modification = 0
-            else:
-                total_no_modification += 1
+        # The binary productions, indexed by the variable on each side of
+        # their bodies
+        # pylint: disable=protected-access
+        productions_by_side = cfg._get_binary_productions_by_side()
+        # The words of each variable, deduplicated, and the ones already
+        # processed, in increasing length
+        seen_d = defaultdict(set)
+        processed_d = defaultdict(list)
+        # The words still to process, by length, starting with the bodies
+        # of length 1
+        agenda = defaultdict(list)
+        for head, word in cfg._get_terminal_words():
+            seen = seen_d[head]
+            if word not in seen:
+                seen.add(word)
+                agenda[1].append((head, word))
+        # The words of the start symbol are given once all the words of a
+        # length are processed, without testing the variable of each word
+        start_words = processed_d[cfg.start_symbol]
+        current_length = 1
+        # Each word is combined once with the words already processed, so
+        # the generation stops by itself for finite grammars
+        while agenda:
+            n_start_words = len(start_words)
+            for variable, word in agenda.pop(current_length, []):
+                processed_d[variable].append(word)
+                for head, new_word in self._get_combined_words(
+                        variable, word, productions_by_side, processed_d,
+                        max_length):
+                    seen = seen_d[head]
+                    if new_word not in seen:
+                        seen.add(new_word)
+                        agenda[len(new_word)].append((head, new_word))
+            for word in start_words[n_start_words:]:
+                yield list(word)
             current_length += 1
-            if total_no_modification > current_length / 2:
-                return
+
+    def _get_terminal_words(self):
+        """ Gives the heads and words of the productions of length 1 """
+        for production in self._productions:
+            if len(production.body) == 1:
+                yield production.head, tuple(production.body)
+
+    def _get_binary_productions_by_side(self):
+        """ Gives the heads and other sides of the binary productions, \
+        indexed by their left and by their right variables """
+        by_left = {}
+        by_right = {}
+        for production in self._productions:
+            body = production.body
+            if len(body) == 2:
+                by_left.setdefault(body[0], []).append(
+                    (production.head, body[1]))
+                by_right.setdefault(body[1], []).append(
+                    (production.head, body[0]))
+        return by_left, by_right
+
+    @staticmethod
+    def _get_combined_words(variable, word, productions_by_side,
+                            processed_d, max_length):
+        """ Gives the words obtained by a binary production from a word of \
+        a variable and the words processed for the other side """
+        by_left, by_right = productions_by_side
+        # The processed words are sorted by length, so the combinations
+        # stop at the first one which is too long
+        max_other_length = None if max_length == -1 \
+            else max_length - len(word)
+        for head, right_variable in by_left.get(variable, []):
+            for other in processed_d.get(right_variable, []):
+                if max_other_length is not None and \
+                        len(other) > max_other_length:
+                    break
+                yield head, word + other
+        for head, left_variable in by_right.get(variable, []):
+            for other in processed_d.get(left_variable, []):
+                if max_other_length is not None and \
+                        len(other) > max_other_length:
+                    break
+                yield head, other + word
 
     def is_finite(self) -> bool:
         """ Tests if the grammar is finite or not
@@ -997,16 +1161,41 @@ class CFG:
             Whether the grammar is finite or not
         """
         normal = self.to_normal_form()
-        di_graph = nx.DiGraph()
-        for production in normal.productions:
-            body = production.body
-            if len(body) == 2:
-                di_graph.add_edge(production.head, body[0])
-                di_graph.add_edge(production.head, body[1])
-        try:
-            nx.find_cycle(di_graph, orientation="original")
-        except nx.exception.NetworkXNoCycle:
-            return True
+        # pylint: disable=protected-access
+        return not normal._has_binary_cycle()
+
+    def _has_binary_cycle(self) -> bool:
+        """ Tests if the binary bodies of a CFG in normal form make a \
+        variable depend on itself """
+        productions_by_head = self._get_productions_by_head()
+
+        def get_successors(variable):
+            return iter([symbol
+                         for production in productions_by_head.get(variable,
+                                                                   [])
+                         if len(production.body) == 2
+                         for symbol in production.body])
+
+        # True while a variable is on the stack, False once it is done
+        in_progress = {}
+        for root in productions_by_head:
+            if root in in_progress:
+                continue
+            in_progress[root] = True
+            to_process = [(root, get_successors(root))]
+            while to_process:
+                variable, successors = to_process[-1]
+                for successor in successors:
+                    if successor not in in_progress:
+                        in_progress[successor] = True
+                        to_process.append(
+                            (successor, get_successors(successor)))
+                        break
+                    if in_progress[successor]:
+                        return True
+                else:
+                    to_process.pop()
+                    in_progress[variable] = False
         return False
 
     def to_text(self):
@@ -1054,7 +1243,8 @@ class CFG:
         cfg : :class:`~pyformlang.cfg.CFG`
             A context free grammar.
         """
-        variables = set()
+        # The variables by name, so that each one is created once
+        variables = {}
         productions = set()
         terminals = set()
         for line in text.splitlines():
@@ -1062,38 +1252,46 @@ class CFG:
             if not line:
                 continue
             cls._read_line(line, productions, terminals, variables)
-        return cls(variables=variables, terminals=terminals,
+        return cls(variables=set(variables.values()), terminals=terminals,
                    productions=productions, start_symbol=start_symbol)
 
+    @staticmethod
+    def _get_variable_by_name(name, variables):
+        """ Gives the variable of the given name, created on its first \
+        occurrence """
+        variable = variables.get(name)
+        if variable is None:
+            variable = Variable(name)
+            variables[name] = variable
+        return variable
+
     @classmethod
     def _read_line(cls, line, productions, terminals, variables):
         head_s, body_s = line.split("->")
         head_text = head_s.strip()
         if is_special_text(head_text):
             head_text = head_text[5:-1]
-        head = Variable(head_text)
-        variables.add(head)
-        for sub_body in body_s.split("|"):
-            body = []
-            for body_component in sub_body.split():
-                if is_special_text(body_component):
-                    type_component = body_component[1:4]
-                    body_component = body_component[5:-1]
-                else:
-                    type_component = ""
-                if body_component[0] in string.ascii_uppercase or \
-                        type_component == "VAR":
-                    body_var = Variable(body_component)
-                    variables.add(body_var)
-                    body.append(body_var)
-                elif body_component not in EPSILON_SYMBOLS or type_component \
-                        == "TER":
-                    body_ter = Terminal(body_component)
-                    terminals.add(body_ter)
-                    body.append(body_ter)
-            productions.add(Production(head, body))
-
-    def is_normal_form(self):
+        head = cls._get_variable_by_name(head_text, variables)
+        body = []
+        for separator, type_component, special_component, body_component \
+                in BODY_TOKEN.findall(body_s):
+            if separator:
+                productions.add(Production(head, body))
+                body = []
+                continue
+            if type_component:
+                body_component = special_component
+            if body_component[0] in VARIABLE_FIRST_CHARACTERS or \
+                    type_component == "VAR":
+                body.append(
+                    cls._get_variable_by_name(body_component, variables))
+            elif body_component not in EPSILON_TEXTS or type_component \
+                    == "TER":
+                body.append(Terminal(body_component))
+                terminals.add(body[-1])
+        productions.add(Production(head, body))
+
+    def is_normal_form(self) -> bool:
         """
         Tells is the current grammar is in Chomsky Normal Form or not
 
@@ -1,5 +1,6 @@
 """ An object in a CFG (Variable and Terminal)"""
 
+import sys
 from typing import Any
 
 
@@ -15,8 +16,16 @@ class CFGObject:  # pylint: disable=too-few-public-methods
     __slots__ = ["_value", "_hash"]
 
     def __init__(self, value: Any):
+        if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+            # Equal names then share the same string, subclasses of str
+            # cannot be interned
+            value = sys.intern(value)
         self._value = value
-        self._hash = None
+        try:
+            self._hash = hash(value)
+        except TypeError:
+            # Unhashable values only fail when the object itself is hashed
+            self._hash = None
 
     @property
     def value(self) -> Any:
@@ -2,10 +2,16 @@
 Representation of a CYK table
 """
 
+import numpy as np
+
 from pyformlang.cfg.parse_tree import ParseTree
 
+# Maximum number of (window, split, production) cells tested at once by the
+# recognition
+_MAX_BLOCK_CELLS = 1 << 22
+
 
-class CYKTable:
+class CYKTable:  # pylint: disable=too-many-instance-attributes
     """
     A CYK table
 
@@ -19,59 +25,127 @@ class CYKTable:
     def __init__(self, cfg, word):
         self._cnf = cfg.to_normal_form()
         self._word = word
-        self._productions_d = {}
+        # The heads of the productions, indexed by terminal for the bodies
+        # of length 1 and by left then right variable for the others, so
+        # that no tuple is built for the lookups
+        self._heads_by_terminal = {}
+        self._heads_by_body = {}
         self._set_productions_by_body()
-        self._cyk_table = {}
-        if not self._generates_all_terminals():
-            self._cyk_table[(0, len(self._word))] = set()
-        else:
-            self._set_cyk_table()
+        # The table is computed on the first query
+        self._variable_ids = None
+        self._variables = None
+        self._binary_productions = None
+        self._productions_by_head = None
+        self._table = None
 
     def _set_productions_by_body(self):
         # Organize productions
         for production in self._cnf.productions:
-            temp = tuple(production.body)
-            if temp in self._productions_d:
-                self._productions_d[temp].append(production.head)
+            body = production.body
+            if len(body) == 1:
+                heads = self._heads_by_terminal.setdefault(body[0], [])
             else:
-                self._productions_d[temp] = [production.head]
-
-    def _set_cyk_table(self):
-        self._initialize_cyk_table()
-        self._propagate_in_cyk_table()
-
-    def _get_windows(self):
-        # The windows must in order by length
-        for window_size in range(2, len(self._word) + 1):
-            for start_window in range(len(self._word) - window_size + 1):
-                yield start_window, start_window + window_size
-
-    def _get_all_window_pairs(self, start_window, end_window):
-        for mid_window in range(start_window + 1, end_window):
-            for var_b in self._cyk_table[(start_window, mid_window)]:
-                for var_c in self._cyk_table[(mid_window, end_window)]:
-                    yield var_b, var_c
-
-    def _propagate_in_cyk_table(self):
-        for start_window, end_window in self._get_windows():
-            for var_b, var_c in self._get_all_window_pairs(start_window,
-                                                           end_window):
-                for var_a in self._productions_d.get((var_b.value,
-                                                      var_c.value), []):
-                    self._cyk_table[(start_window, end_window)].add(
-                        CYKNode(var_a, var_b, var_c))
-
-    def _initialize_cyk_table(self):
-        for i, terminal in enumerate(self._word):
-            self._cyk_table[(i, i + 1)] = \
-                {CYKNode(x, CYKNode(terminal))
-                 for x in self._productions_d[(terminal,)]}
-        for window_size in range(2, len(self._word) + 1):
-            for start_window in range(len(self._word) - window_size + 1):
-                # We use set because we do not want duplicate
-                # It makes iterations longer
-                self._cyk_table[
-                    (start_window, start_window + window_size)] = set()
+                heads = self._heads_by_body.setdefault(
+                    body[0], {}).setdefault(body[1], [])
+            heads.append(production.head)
+
+    def _get_integer_productions(self):
+        """ Gives the productions where the variables are replaced by \
+        integers, as used by the recognition """
+        variable_ids = {}
+        terminal_productions = {}
+        heads, lefts, rights = [], [], []
+        for terminal, terminal_heads in self._heads_by_terminal.items():
+            terminal_productions[terminal] = [
+                variable_ids.setdefault(head, len(variable_ids))
+                for head in terminal_heads]
+        for left_variable, heads_by_right in self._heads_by_body.items():
+            left = variable_ids.setdefault(left_variable, len(variable_ids))
+            for right_variable, body_heads in heads_by_right.items():
+                right = variable_ids.setdefault(right_variable,
+                                                len(variable_ids))
+                for head in body_heads:
+                    heads.append(variable_ids.setdefault(head,
+                                                         len(variable_ids)))
+                    lefts.append(left)
+                    rights.append(right)
+        return variable_ids, terminal_productions, \
+            (np.array(heads, dtype=np.int64),
+             np.array(lefts, dtype=np.int64),
+             np.array(rights, dtype=np.int64))
+
+    def _set_table(self):
+        """ Fills the table, where a cell is a boolean vector indexed by \
+        the ids of the variables """
+        self._variable_ids, terminal_productions, self._binary_productions = \
+            self._get_integer_productions()
+        # The ids are given in order, so they index this list
+        self._variables = list(self._variable_ids)
+        size = len(self._word)
+        self._table = np.zeros((size, size + 1, len(self._variable_ids)),
+                               dtype=bool)
+        # The cells of the letters are filled at once, from one row per
+        # distinct terminal of the word
+        terminal_ids = {}
+        letters = [terminal_ids.setdefault(terminal, len(terminal_ids))
+                   for terminal in self._word]
+        terminal_cells = np.zeros((len(terminal_ids), len(self._variable_ids)),
+                                  dtype=bool)
+        for terminal, terminal_id in terminal_ids.items():
+            terminal_cells[terminal_id, terminal_productions[terminal]] = True
+        positions = np.arange(size)
+        self._table[positions, positions + 1] = terminal_cells[letters]
+        for window_size in range(2, size):
+            self._fill_windows(window_size)
+        if size > 1:
+            self._fill_full_window()
+
+    def _fill_full_window(self):
+        """ Fills the window of the whole word, where only the start \
+        symbol matters """
+        size = len(self._word)
+        start_id = self._variable_ids.get(self._cnf.start_symbol)
+        productions = self._get_productions_by_head().get(start_id)
+        if productions is None:
+            return
+        _, lefts, rights = self._binary_productions
+        left_cells = self._table[0, 1:size]
+        right_cells = self._table[1:size, size]
+        # Only the productions of the start symbol are tested
+        if np.any(left_cells[:, lefts[productions]] &
+                  right_cells[:, rights[productions]]):
+            self._table[0, size, start_id] = True
+
+    def _fill_windows(self, window_size):
+        """ Fills all the windows of the same size """
+        n_windows = len(self._word) - window_size + 1
+        # All the windows of the same size are independent, they are filled
+        # at once, by blocks to bound the memory used
+        block_size = max(1, _MAX_BLOCK_CELLS //
+                         ((window_size - 1) *
+                          max(len(self._binary_productions[0]), 1)))
+        for block_start in range(0, n_windows, block_size):
+            self._fill_windows_block(
+                np.arange(block_start,
+                          min(block_start + block_size, n_windows)),
+                window_size)
+
+    def _fill_windows_block(self, starts, window_size):
+        """ Fills the windows of the same size starting at the given \
+        positions """
+        heads, lefts, rights = self._binary_productions
+        # Left and right cells of all the splits of the windows, indexed by
+        # window, split and variable
+        middles = starts[:, None] + np.arange(1, window_size)[None, :]
+        left_cells = self._table[starts[:, None], middles]
+        right_cells = self._table[middles, (starts + window_size)[:, None]]
+        # All the splits and binary productions are tested at once
+        generated = np.any(left_cells[:, :, lefts] &
+                           right_cells[:, :, rights], axis=1)
+        windows, productions = np.nonzero(generated)
+        generating_starts = starts[windows]
+        self._table[generating_starts, generating_starts + window_size,
+                    heads[productions]] = True
 
     def generate_word(self):
         """
@@ -81,14 +155,18 @@ class CYKTable:
         is_generated : bool
 
         """
-        return self._cnf.start_symbol in self._cyk_table[(0, len(self._word))]
+        if not self._generates_all_terminals():
+            return False
+        if self._table is None:
+            self._set_table()
+        start_id = self._variable_ids.get(self._cnf.start_symbol)
+        if start_id is None:
+            return False
+        return bool(self._table[0, len(self._word), start_id])
 
     def _generates_all_terminals(self):
-        generate_all_terminals = True
-        for terminal in self._word:
-            if (terminal,) not in self._productions_d:
-                generate_all_terminals = False
-        return generate_all_terminals
+        return all(terminal in self._heads_by_terminal
+                   for terminal in self._word)
 
     def get_parse_tree(self):
         """
@@ -98,37 +176,83 @@ class CYKTable:
         -------
         parse_tree : :class:`~pyformlang.cfg.ParseTree`
         """
-        if self._word and not self.generate_word():
-            raise DerivationDoesNotExist
         if not self._word:
             return CYKNode(self._cnf.start_symbol)
-        root = [
-            x
-            for x in self._cyk_table[(0, len(self._word))]
-            if x == self._cnf.start_symbol][0]
+        if not self.generate_word():
+            raise DerivationDoesNotExist
+        # The tree is rebuilt from the root, following a single derivation
+        root = CYKNode(self._cnf.start_symbol)
+        to_process = [(root, 0, len(self._word))]
+        while to_process:
+            node, start_window, end_window = to_process.pop()
+            if end_window - start_window == 1:
+                node.set_sons(CYKNode(self._word[start_window]))
+                continue
+            left_son, mid_window, right_son = self._get_split(
+                node.value, start_window, end_window)
+            node.set_sons(left_son, right_son)
+            to_process.append((right_son, mid_window, end_window))
+            to_process.append((left_son, start_window, mid_window))
         return root
 
+    def _get_productions_by_head(self):
+        """ Gives the indexes of the binary productions of each head id """
+        if self._productions_by_head is None:
+            heads = self._binary_productions[0]
+            order = np.argsort(heads, kind="stable")
+            head_ids, starts = np.unique(heads[order], return_index=True)
+            self._productions_by_head = dict(
+                zip(head_ids.tolist(), np.split(order, starts[1:])))
+        return self._productions_by_head
+
+    def _get_split(self, variable, start_window, end_window):
+        """ Gives a split of the window and the sons generating both sides \
+        of it """
+        _, lefts, rights = self._binary_productions
+        # The productions are looked up by head, without scanning them all
+        productions = self._get_productions_by_head()[
+            self._variable_ids[variable]]
+        left_cells = self._table[start_window, start_window + 1:end_window]
+        right_cells = self._table[start_window + 1:end_window, end_window]
+        # The first split and production deriving both sides are used
+        split, production = np.argwhere(
+            left_cells[:, lefts[productions]] &
+            right_cells[:, rights[productions]])[0]
+        production = productions[production]
+        return (CYKNode(self._variables[lefts[production]]),
+                start_window + 1 + split,
+                CYKNode(self._variables[rights[production]]))
+
 
 class CYKNode(ParseTree):
     """A node in the CYK table"""
 
+    # Many nodes are created, one per node of the parse trees
+    __slots__ = ["left_son", "right_son", "_hash"]
+
     def __init__(self, value, left_son=None, right_son=None):
         super().__init__(value)
-        self.value = value
+        self.left_son = None
+        self.right_son = None
+        self.set_sons(left_son, right_son)
+        # The value of a node is not changed once created
+        self._hash = hash(value)
+
+    def set_sons(self, left_son=None, right_son=None):
+        """ Sets the sons of the node """
         self.left_son = left_son
         self.right_son = right_son
-        if left_son is not None:
-            self.sons.append(left_son)
-        if right_son is not None:
-            self.sons.append(right_son)
+        self.sons = [son for son in (left_son, right_son) if son is not None]
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, CYKNode):
             return self.value == other.value
         return self.value == other
 
     def __hash__(self):
-        return hash(self.value)
+        return self._hash
 
 
 class DerivationDoesNotExist(Exception):
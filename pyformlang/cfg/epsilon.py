@@ -7,8 +7,31 @@ class Epsilon(Terminal):
     """ An epsilon terminal """
     # pylint: disable=too-few-public-methods
 
-    def __init__(self):
-        super().__init__("epsilon")
+    __slots__ = []
+
+    kind = "E"
+
+    # The epsilon terminal is unique
+    _instance = None
+
+    def __new__(cls):  # pylint: disable=signature-differs
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            Terminal.__init__(cls._instance, "epsilon")
+        return cls._instance
+
+    def __init__(self):  # pylint: disable=super-init-not-called
+        # The unique instance is initialized when created
+        pass
+
+    def __getnewargs__(self):
+        return ()
+
+    def __eq__(self, other):
+        return self is other
+
+    def __hash__(self):
+        return self._hash
 
     def to_text(self) -> str:
         return "epsilon"
@@ -1,15 +1,23 @@
 """ LL(1) Parser """
 
+from collections import defaultdict
 
 from pyformlang.cfg.epsilon import Epsilon
 from pyformlang.cfg.cfg import NotParsableException
 from pyformlang.cfg.parse_tree import ParseTree
 from pyformlang.cfg.set_queue import SetQueue
-from pyformlang.cfg.utils import to_terminal
-from pyformlang.cfg.utils_cfg import get_productions_d
+from pyformlang.cfg.utils import to_terminal_word
 
+# Shared constants, so that they are not created again at each lookup
+_EPSILON = Epsilon()
+_EMPTY_SET = frozenset()
+# The mask of epsilon in the first sets, whose id is always 0
+_EPSILON_MASK = 1
+# The id of the end of the word
+_END_ID = 1
 
-class LLOneParser:
+
+class LLOneParser:  # pylint: disable=too-many-instance-attributes
     """
     A LL(1) parser
 
@@ -21,159 +29,240 @@ class LLOneParser:
 
     def __init__(self, cfg):
         self._cfg = cfg
+        # The symbols of the first and follow sets, whose ids are the bits
+        # of the masks representing these sets during the computations
+        self._lookaheads = None
+        self._lookahead_ids = None
+        self._triggers = None
+        self._epsilon_heads = None
+        self._first_masks = None
+        self._follow_masks = None
+        self._llone_parsing_table = None
+        # Whether the parsing table has no conflict, found while building it
+        self._is_llone_parsable = None
+        self._prediction_table = None
+
+    def _get_lookahead_ids(self):
+        """ Gives the bit of each symbol which can be in a first or follow \
+        set, epsilon being the first one """
+        if self._lookahead_ids is None:
+            self._lookaheads = [_EPSILON, "$"]
+            self._lookahead_ids = {_EPSILON: 0, "$": 1}
+            for terminal in self._cfg.terminals:
+                if terminal not in self._lookahead_ids:
+                    self._lookahead_ids[terminal] = len(self._lookaheads)
+                    self._lookaheads.append(terminal)
+        return self._lookahead_ids
+
+    def _to_set(self, mask):
+        """ Gives the symbols of a mask """
+        symbols = set()
+        while mask:
+            lowest_bit = mask & -mask
+            symbols.add(self._lookaheads[lowest_bit.bit_length() - 1])
+            mask ^= lowest_bit
+        return symbols
 
     def get_first_set(self):
         """ Used in LL(1) """
+        return {symbol: self._to_set(mask)
+                for symbol, mask in self._get_first_masks().items()}
+
+    def _get_first_masks(self):
+        if self._first_masks is None:
+            self._first_masks = self._compute_first_masks()
+        return self._first_masks
+
+    def _compute_first_masks(self):
         # Algorithm from:
         # https://www.geeksforgeeks.org/first-set-in-syntax-analysis/
+        # The sets are masks of the ids of their symbols, so that a union
+        # is a single bitwise or
         triggers = self._get_triggers()
-        first_set, to_process = self._initialize_first_set(triggers)
-        production_by_head = get_productions_d(self._cfg.productions)
+        first_masks, to_process = self._initialize_first_masks(triggers)
+        # pylint: disable=protected-access
+        production_by_head = self._cfg._get_productions_by_head()
         while to_process:
             current = to_process.pop()
             for production in production_by_head[current]:
                 if not production.body:
                     continue
-                first_set_temp = self._get_first_set_production(production,
-                                                                first_set)
-                length_before = len(first_set.get(production.head, set()))
-                first_set[production.head] = first_set.get(
-                    production.head, set()).union(
-                        first_set_temp)
-                if len(first_set[production.head]) != length_before:
-                    for triggered in triggers.get(production.head, []):
+                mask_before = first_masks.get(production.head, 0)
+                new_mask = mask_before | \
+                    self._get_first_mask_production(production, first_masks)
+                first_masks[production.head] = new_mask
+                if new_mask != mask_before:
+                    for triggered in triggers.get(production.head,
+                                                  _EMPTY_SET):
                         to_process.append(triggered)
-        return first_set
+        return first_masks
 
     @staticmethod
-    def _get_first_set_production(production, first_set):
-        first_not_containing_epsilon = 0
-        first_set_temp = set()
+    def _get_first_mask_production(production, first_masks):
+        first_mask = 0
         for body_component in production.body:
-            first_set_temp = first_set_temp.union(
-                first_set.get(
-                    production.body[first_not_containing_epsilon],
-                    set()))
-            if Epsilon() not in first_set.get(body_component, set()):
-                break
-            first_not_containing_epsilon += 1
-        if first_not_containing_epsilon != len(production.body):
-            if Epsilon() in first_set_temp:
-                first_set_temp.remove(Epsilon())
-        return first_set_temp
-
-    def _initialize_first_set(self, triggers):
+            component_mask = first_masks.get(body_component, 0)
+            first_mask |= component_mask
+            if not component_mask & _EPSILON_MASK:
+                # Epsilon is only kept when the whole body is nullable
+                return first_mask & ~_EPSILON_MASK
+        return first_mask
+
+    def _initialize_first_masks(self, triggers):
         to_process = SetQueue()
-        first_set = {}
+        first_masks = {}
+        lookahead_ids = self._get_lookahead_ids()
         # Initialisation
         for terminal in self._cfg.terminals:
-            first_set[terminal] = {terminal}
-            for triggered in triggers.get(terminal, []):
+            first_masks[terminal] = 1 << lookahead_ids[terminal]
+            for triggered in triggers.get(terminal, _EMPTY_SET):
                 to_process.append(triggered)
         # Generate only epsilon
-        for production in self._cfg.productions:
-            if not production.body:
-                first_set[production.head] = {Epsilon()}
-                for triggered in triggers.get(production.head, []):
-                    to_process.append(triggered)
-        return first_set, to_process
+        for head in self._epsilon_heads:
+            first_masks[head] = _EPSILON_MASK
+            for triggered in triggers.get(head, _EMPTY_SET):
+                to_process.append(triggered)
+        return first_masks, to_process
 
     def _get_triggers(self):
-        triggers = {}
-        for production in self._cfg.productions:
-            for body_component in production.body:
-                if body_component not in triggers:
-                    triggers[body_component] = []
-                triggers[body_component].append(production.head)
-        return triggers
+        """ Gives the heads of the productions using each symbol in their \
+        body, the heads of the epsilon productions being found in the same \
+        pass """
+        if self._triggers is None:
+            self._triggers = defaultdict(list)
+            self._epsilon_heads = set()
+            for production in self._cfg.productions:
+                if not production.body:
+                    self._epsilon_heads.add(production.head)
+                for body_component in production.body:
+                    self._triggers[body_component].append(production.head)
+        return self._triggers
 
     def get_follow_set(self):
         """ Get follow set """
-        first_set = self.get_first_set()
-        triggers = self._get_triggers_follow_set(first_set)
-        follow_set, to_process = self._initialize_follow_set(first_set)
+        return {symbol: self._to_set(mask)
+                for symbol, mask in self._get_follow_masks().items()}
+
+    def _get_follow_masks(self):
+        if self._follow_masks is None:
+            self._follow_masks = self._compute_follow_masks()
+        return self._follow_masks
+
+    def _compute_follow_masks(self):
+        follow_masks, to_process, triggers = self._initialize_follow_masks(
+            self._get_first_masks())
         while to_process:
             current = to_process.pop()
-            for triggered in triggers.get(current, set()):
-                length_before = len(follow_set.get(triggered, set()))
-                follow_set[triggered] = follow_set.get(
-                    triggered, set()
-                ).union(follow_set.get(current, set()))
-                if length_before != len(follow_set[triggered]):
+            current_mask = follow_masks.get(current, 0)
+            for triggered in triggers.get(current, _EMPTY_SET):
+                mask_before = follow_masks.get(triggered, 0)
+                if mask_before | current_mask != mask_before:
+                    follow_masks[triggered] = mask_before | current_mask
                     to_process.append(triggered)
-        return follow_set
+        return follow_masks
 
-    def _initialize_follow_set(self, first_set):
+    def _initialize_follow_masks(self, first_masks):
         to_process = SetQueue()
-        follow_set = {}
-        follow_set[self._cfg.start_symbol] = {"$"}
+        follow_masks = {}
+        follow_masks[self._cfg.start_symbol] = \
+            1 << self._get_lookahead_ids()["$"]
         to_process.append(self._cfg.start_symbol)
+        # The triggers are collected in the same pass over the bodies
+        triggers = defaultdict(set)
         for production in self._cfg.productions:
-            for i, component in enumerate(production.body):
-                for component_next in production.body[i + 1:]:
-                    follow_set[component] = follow_set.get(
-                        component, set()
-                    ).union(first_set.get(component_next, set()))
-                    if Epsilon() not in first_set.get(component_next,
-                                                      set()):
-                        break
-                if Epsilon() in follow_set.get(component, set()):
-                    follow_set[component].remove(Epsilon())
-                if follow_set.get(component, set()):
+            head_triggers = triggers[production.head]
+            # The symbols which can follow a component are built from the
+            # end of the body, without scanning the suffix of each component
+            following = None
+            # Whether all the components after the current one are nullable
+            nullable_suffix = True
+            for component in reversed(production.body):
+                if nullable_suffix:
+                    head_triggers.add(component)
+                component_follow = follow_masks.get(component, 0)
+                if following is not None:
+                    component_follow = \
+                        (component_follow | following) & ~_EPSILON_MASK
+                    follow_masks[component] = component_follow
+                if component_follow:
                     to_process.append(component)
-        return follow_set, to_process
-
-    def _get_triggers_follow_set(self, first_set):
-        triggers = {}
-        for production in self._cfg.productions:
-            if production.head not in triggers:
-                triggers[production.head] = set()
-            for i, component in enumerate(production.body):
-                all_epsilon = True
-                for component_next in production.body[i + 1:]:
-                    if Epsilon() not in first_set.get(component_next, set()):
-                        all_epsilon = False
-                        break
-                if all_epsilon:
-                    triggers[production.head].add(component)
-        return triggers
+                component_mask = first_masks.get(component, 0)
+                nullable_suffix = nullable_suffix and \
+                    component_mask & _EPSILON_MASK
+                if following is not None and component_mask & _EPSILON_MASK:
+                    following |= component_mask
+                else:
+                    following = component_mask
+        return follow_masks, to_process, triggers
 
     def get_llone_parsing_table(self):
         """ Get the LL(1) parsing table
         From:
         https://www.slideshare.net/MahbuburRahman273/ll1-parser-in-compilers
         """
-        first_set = self.get_first_set()
-        follow_set = self.get_follow_set()
-        nullables = self._cfg.get_nullable_symbols()
-        nullable_productions = []
-        non_nullable_productions = []
+        return {variable: {terminal: list(productions)
+                           for terminal, productions in row.items()}
+                for variable, row in self._get_llone_parsing_table().items()}
+
+    def _get_llone_parsing_table(self):
+        if self._llone_parsing_table is None:
+            self._llone_parsing_table = self._compute_llone_parsing_table()
+        return self._llone_parsing_table
+
+    def _compute_llone_parsing_table(self):
+        first_masks = self._get_first_masks()
+        follow_masks = self._get_follow_masks()
+        llone_parsing_table = defaultdict(dict)
+        self._is_llone_parsable = True
+        # The productions are dispatched in a single pass, on the follow set
+        # of their head when their body is nullable and on their first set
+        # otherwise
         for production in self._cfg.productions:
-            if all(x in nullables for x in production.body):
-                nullable_productions.append(production)
-            else:
-                non_nullable_productions.append(production)
-        llone_parsing_table = {}
-        for production in nullable_productions:
-            if production.head not in llone_parsing_table:
-                llone_parsing_table[production.head] = {}
-            for first in follow_set.get(production.head, set()):
-                if first not in llone_parsing_table[production.head]:
-                    llone_parsing_table[production.head][first] = []
-                llone_parsing_table[production.head][first].append(
-                    production
-                )
-        for production in non_nullable_productions:
-            if production.head not in llone_parsing_table:
-                llone_parsing_table[production.head] = {}
-            for first in self._get_first_set_production(production,
-                                                        first_set):
-                if first not in llone_parsing_table[production.head]:
-                    llone_parsing_table[production.head][first] = []
-                llone_parsing_table[production.head][first].append(
-                    production
-                )
-        return llone_parsing_table
+            lookaheads = self._get_first_mask_production(production,
+                                                         first_masks)
+            # The first sets already tell which bodies are nullable
+            if not production.body or lookaheads & _EPSILON_MASK:
+                lookaheads = follow_masks.get(production.head, 0)
+            row = llone_parsing_table[production.head]
+            for lookahead in self._to_set(lookaheads):
+                cell = row.setdefault(lookahead, [])
+                cell.append(production)
+                if len(cell) > 1:
+                    self._is_llone_parsable = False
+        return dict(llone_parsing_table)
+
+    def _get_prediction_table(self):
+        """ Keeps the entries of the parsing table which predict a single \
+        production, the others cannot be used by the parser.
+
+        Each variable has a row indexed by the ids of the lookaheads, with \
+        a last cell for the symbols out of the grammar. A cell holds the \
+        predicted production with, for each component of its body, the row \
+        of a variable or the id of a terminal.
+        """
+        if self._prediction_table is None:
+            lookahead_ids = self._get_lookahead_ids()
+            size = len(self._lookaheads) + 1
+            self._prediction_table = {}
+            predictions = []
+            for variable, row in self._get_llone_parsing_table().items():
+                row_ids = [None] * size
+                self._prediction_table[variable] = row_ids
+                for terminal, productions in row.items():
+                    if len(productions) == 1:
+                        predictions.append(
+                            (row_ids, lookahead_ids[terminal], productions[0]))
+            empty_row = [None] * size
+            for row_ids, lookahead_id, production in predictions:
+                components = []
+                for component in production.body:
+                    if component.kind == "V":
+                        components.append(self._prediction_table.get(
+                            component, empty_row))
+                    else:
+                        components.append(lookahead_ids.get(component, -1))
+                row_ids[lookahead_id] = (production, components[::-1])
+        return self._prediction_table
 
     def is_llone_parsable(self):
         """
@@ -183,12 +272,9 @@ class LLOneParser:
         -------
         is_parsable : bool
         """
-        parsing_table = self.get_llone_parsing_table()
-        for variable in parsing_table.values():
-            for terminal in variable.values():
-                if len(terminal) > 1:
-                    return False
-        return True
+        if self._is_llone_parsable is None:
+            self._get_llone_parsing_table()
+        return self._is_llone_parsable
 
     def get_llone_parse_tree(self, word):
         """
@@ -210,27 +296,46 @@ class LLOneParser:
             When the word cannot be parsed
 
         """
-        word = [to_terminal(x) for x in word if x != Epsilon()]
-        word.append("$")
-        word = word[::-1]
-        parsing_table = self.get_llone_parsing_table()
+        parse_tree = self._get_llone_parse_tree(word)
+        if parse_tree is None:
+            raise NotParsableException
+        return parse_tree
+
+    def _get_llone_parse_tree(self, word):
+        """ Gives the parse tree, or None when the word cannot be parsed """
+        prediction_table = self._get_prediction_table()
+        # The letters are read as ids, which index the rows of the variables
+        lookahead_ids = self._get_lookahead_ids()
+        unknown_id = len(self._lookaheads)
+        word_ids = [lookahead_ids.get(letter, unknown_id)
+                    for letter in to_terminal_word(word)]
+        word_ids.append(_END_ID)
+        # The word is read from left to right with a cursor
+        position = 0
         parse_tree = ParseTree(self._cfg.start_symbol)
-        stack = ["$", parse_tree]
+        # The stack holds the trees to expand with the row of their variable
+        # or the id of their terminal, the end of the word being at the bottom
+        stack = [None, (parse_tree, prediction_table.get(
+            self._cfg.start_symbol, [None] * (unknown_id + 1)))]
         while stack:
             current = stack.pop()
-            if current == "$" and word[-1] == "$":
-                return parse_tree
-            if current.value == word[-1]:
-                word.pop()
+            if current is None:
+                if word_ids[position] == _END_ID:
+                    return parse_tree
+                return None
+            current_tree, expected = current
+            if isinstance(expected, int):
+                if expected != word_ids[position]:
+                    return None
+                position += 1
             else:
-                rule_applied = list(parsing_table.get(current.value, {})
-                                    .get(word[-1], []))
-                if len(rule_applied) == 1:
-                    for component in rule_applied[0].body[::-1]:
-                        new_node = ParseTree(component)
-                        current.sons.append(new_node)
-                        stack.append(new_node)
-                else:
-                    raise NotParsableException
-                current.sons = current.sons[::-1]
-        raise NotParsableException
+                prediction = expected[word_ids[position]]
+                if prediction is None:
+                    return None
+                production, components = prediction
+                # The sons are created in order and pushed in reverse, so
+                # that the first one is processed first
+                current_tree.sons = [ParseTree(component)
+                                     for component in production.body]
+                stack.extend(zip(reversed(current_tree.sons), components))
+        return None
@@ -9,6 +9,8 @@ from pyformlang.cfg.variable import Variable
 class ParseTree:
     """ A parse tree """
 
+    __slots__ = ["value", "sons"]
+
     def __init__(self, value):
         self.value = value
         self.sons = []
@@ -62,7 +64,7 @@ class ParseTree:
             return [[self.value]]
         res = [[self.value]]
         end = []
-        for i, son in enumerate(self.sons[::-1]):
+        for i, son in enumerate(reversed(self.sons)):
             start = [x.value for x in self.sons[:-1 - i]]
             derivation = []
             derivations = son.get_rightmost_derivation()
@@ -85,7 +87,7 @@ class ParseTree:
         """
         tree = nx.DiGraph()
         tree.add_node("ROOT", label=self.value.value)
-        to_process = [("ROOT", son) for son in self.sons[::-1]]
+        to_process = [("ROOT", son) for son in reversed(self.sons)]
         counter = 0
         while to_process:
             previous_node, current_node = to_process.pop()
@@ -96,7 +98,8 @@ class ParseTree:
                 tree.add_node(new_node, label=current_node.value.value)
             counter += 1
             tree.add_edge(previous_node, new_node)
-            to_process += [(new_node, son) for son in current_node.sons[::-1]]
+            to_process.extend((new_node, son)
+                              for son in reversed(current_node.sons))
         return tree
 
     def write_as_dot(self, filename):
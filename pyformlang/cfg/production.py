@@ -1,7 +1,6 @@
 """ A production or rule of a CFG """
 from typing import List
 
-from .terminal import Terminal
 from .variable import Variable
 from .cfg_object import CFGObject
 from .epsilon import Epsilon
@@ -18,15 +17,29 @@ class Production:
         The body of the production
     """
 
-    __slots__ = ["_body", "_head", "_hash"]
+    __slots__ = ["_body", "_head", "_hash", "_repr"]
 
     def __init__(self, head: Variable, body: List[CFGObject], filtering=True):
         if filtering:
-            self._body = [x for x in body if not isinstance(x, Epsilon)]
+            # The body is copied, so that the cached hash stays valid, and
+            # only filtered when it contains an epsilon, which is rare
+            self._body = list(body)
+            for body_component in self._body:
+                if isinstance(body_component, Epsilon):
+                    self._body = [x for x in self._body
+                                  if not isinstance(x, Epsilon)]
+                    break
         else:
             self._body = body
         self._head = head
-        self._hash = None
+        # Productions are hashed a lot when stored in sets, so the hash is
+        # computed once here when the symbols can be hashed
+        try:
+            self._hash = self._compute_hash()
+        except TypeError:
+            # Unhashable bodies only fail when the production is hashed
+            self._hash = None
+        self._repr = None
 
     @property
     def head(self) -> Variable:
@@ -39,14 +52,28 @@ class Production:
         return self._body
 
     def __repr__(self):
-        return str(self.head) + " -> " + " ".join([str(x) for x in self.body])
+        if self._repr is None:
+            self._repr = str(self.head) + " -> " + \
+                " ".join([str(x) for x in self.body])
+        return self._repr
 
     def __hash__(self):
         if self._hash is None:
-            self._hash = sum(map(hash, self._body)) + hash(self._head)
+            self._hash = self._compute_hash()
         return self._hash
 
+    def _compute_hash(self):
+        # The hash depends on the order of the body
+        return hash((self._head, tuple(self._body)))
+
     def __eq__(self, other):
+        if self is other:
+            return True
+        # The cached hashes discard most of the different productions
+        # without comparing the bodies, when both of them are known
+        if isinstance(other, Production) and self._hash is not None and \
+                other._hash is not None and self._hash != other._hash:
+            return False
         return self.head == other.head and self.body == other.body
 
     def is_normal_form(self):
@@ -59,9 +86,9 @@ class Production:
             If the production is in CNF
 
         """
+        # The symbols are dispatched on their kind tag, without isinstance
         if len(self._body) == 2:
-            return (isinstance(self._body[0], Variable) and
-                    isinstance(self._body[1], Variable))
+            return self._body[0].kind == "V" and self._body[1].kind == "V"
         if len(self._body) == 1:
-            return isinstance(self._body[0], Terminal)
+            return self._body[0].kind != "V"
         return False
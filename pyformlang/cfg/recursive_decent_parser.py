@@ -2,10 +2,10 @@
 A recursive decent parser.
 """
 
-from pyformlang.cfg import Variable, Epsilon
+from pyformlang.cfg import Variable
 from pyformlang.cfg.cfg import NotParsableException
 from pyformlang.cfg.parse_tree import ParseTree
-from pyformlang.cfg.utils import to_terminal
+from pyformlang.cfg.utils import to_terminal_word
 
 
 def _get_index_to_extend(current_expansion, left):
@@ -31,6 +31,9 @@ class RecursiveDecentParser:
 
     def __init__(self, cfg):
         self._cfg = cfg
+        # Each expansion only needs the productions of one variable
+        # pylint: disable=protected-access
+        self._productions_d = cfg._get_productions_by_head()
 
     def get_parse_tree(self, word, left=True):
         """
@@ -55,12 +58,19 @@ class RecursiveDecentParser:
                 When the word cannot be parsed
 
         """
-        word = [to_terminal(x) for x in word if x != Epsilon()]
+        parse_tree = self._get_parse_tree(word, left)
+        if parse_tree is None:
+            raise NotParsableException
+        return parse_tree
+
+    def _get_parse_tree(self, word, left):
+        """ Gives the parse tree, or None when the word cannot be parsed """
+        word = to_terminal_word(word)
         parse_tree = ParseTree(self._cfg.start_symbol)
         starting_expansion = [(self._cfg.start_symbol, parse_tree)]
         if self._get_parse_tree_sub(word, starting_expansion, left):
             return parse_tree
-        raise NotParsableException
+        return None
 
     def _match(self, word, current_expansion, idx_word=0,
                idx_current_expansion=0):
@@ -91,13 +101,12 @@ class RecursiveDecentParser:
             return True
         begin = current_expansion[:extend_idx]
         end = current_expansion[extend_idx + 1:]
-        for production in self._cfg.productions:
-            if production.head == to_expand[0]:
-                replacement = [(x, ParseTree(x)) for x in production.body]
-                new_expansion = begin + replacement + end
-                if self._get_parse_tree_sub(word, new_expansion, left):
-                    to_expand[1].sons = [x[1] for x in replacement]
-                    return True
+        for production in self._productions_d.get(to_expand[0], []):
+            replacement = [(x, ParseTree(x)) for x in production.body]
+            new_expansion = begin + replacement + end
+            if self._get_parse_tree_sub(word, new_expansion, left):
+                to_expand[1].sons = [x[1] for x in replacement]
+                return True
         return False
 
     def is_parsable(self, word, left=True):
@@ -119,16 +128,10 @@ class RecursiveDecentParser:
 
         Raises
         --------
-        NotParsableException
-            When the word cannot be parsed
         RecursionError
             If the recursion goes too deep. This error occurs because some \
             the algorithm is not guaranteed to terminate with left/right \
             recursive grammars.
 
         """
-        try:
-            self.get_parse_tree(word, left)
-        except NotParsableException:
-            return False
-        return True
+        return self._get_parse_tree(word, left) is not None
@@ -1,11 +1,15 @@
 """ A queue with non duplicate elements"""
 
+from collections import deque
+
 
 class SetQueue:
     """ A queue with non duplicate elements"""
 
     def __init__(self):
-        self._to_process = []
+        # The elements are processed in order of arrival, so a change
+        # reaches all the elements it impacts before they are revisited
+        self._to_process = deque()
         self._processing = set()
 
     def append(self, value):
@@ -16,8 +20,8 @@ class SetQueue:
 
     def pop(self):
         """ Pop an element """
-        popped = self._to_process.pop()
-        self._processing.remove(popped)
+        popped = self._to_process.popleft()
+        self._processing.discard(popped)
         return popped
 
     def __bool__(self):
@@ -1,4 +1,5 @@
 """ A terminal in a CFG """
+from weakref import WeakValueDictionary
 
 from .cfg_object import CFGObject
 
@@ -6,8 +7,49 @@ from .cfg_object import CFGObject
 class Terminal(CFGObject):  # pylint: disable=too-few-public-methods
     """ A terminal in a CFG """
 
+    # The weak reference is needed by the table of shared instances
+    __slots__ = ["__weakref__"]
+
+    # Tag used to dispatch on the kind of symbol without isinstance
+    kind = "T"
+
+    # Terminals are immutable, so equal terminals share a single instance
+    _instances = WeakValueDictionary()
+
+    def __new__(cls, value=None):
+        if cls is not Terminal:
+            return super().__new__(cls)
+        key = (type(value), value)
+        try:
+            terminal = cls._instances.get(key)
+        except TypeError:
+            # Unhashable values cannot be shared
+            return super().__new__(cls)
+        if terminal is None:
+            terminal = super().__new__(cls)
+            # A shared instance is only initialized when it is created
+            CFGObject.__init__(terminal, value)
+            cls._instances[key] = terminal
+        return terminal
+
+    def __init__(self, value=None):
+        # Equal values can display differently, as 1 and True in a tuple,
+        # so a shared instance keeps the value it was created with
+        if not hasattr(self, "_value"):
+            super().__init__(value)
+
+    def __getnewargs__(self):
+        return (self._value,)
+
+    def __reduce__(self):
+        # Without a state, unpickling does not overwrite a shared instance
+        return self.__class__, self.__getnewargs__()
+
     def __eq__(self, other):
-        return isinstance(other, Terminal) and self.value == other.value
+        # Equal terminals are mostly the same shared instance
+        if self is other:
+            return True
+        return isinstance(other, Terminal) and self._value == other.value
 
     def __repr__(self):
         return "Terminal(" + str(self.value) + ")"
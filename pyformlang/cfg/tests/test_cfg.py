@@ -497,6 +497,14 @@ class TestCFG:
         assert [ter_a, ter_a] in words0
         assert len(words0) == 3
 
+    def test_generation_words_finite(self):
+        cfg = CFG.from_text("""S -> a | A A A A A A A A A A A A A A A A A
+                               A -> b""")
+        words = list(cfg.get_words())
+        assert len(words) == 2
+        assert [Terminal("a")] in words
+        assert [Terminal("b")] * 17 in words
+
     def test_finite(self):
         """ Tests whether a grammar is finite or not """
         ter_a = Terminal("a")
@@ -769,6 +777,25 @@ class TestCFG:
         assert cfg.contains(["a", "b"])
         assert ["a", "b"] in cfg
 
+    def test_from_text_compact_bodies(self):
+        text = 'S -> a"TER:B"|"VAR:c" $||"TER:$"\nc -> d'
+        cfg = CFG.from_text(text)
+        assert len(cfg.productions) == 5
+        assert cfg.contains(['a"TER:B"'])
+        assert cfg.contains(["d"])
+        assert cfg.contains([])
+        assert cfg.contains(["$"])
+        assert Terminal("B") not in cfg.terminals
+
+    def test_from_text_shares_variables(self):
+        cfg = CFG.from_text("S -> A A\nA -> a | S")
+        variables = [symbol
+                     for production in cfg.productions
+                     for symbol in [production.head] + production.body
+                     if isinstance(symbol, Variable) and symbol.value == "A"]
+        assert len(variables) == 4
+        assert all(variable is variables[0] for variable in variables)
+
     def test_from_text_union(self):
         text = """
         "VAR:S" -> TER:a | b
@@ -842,6 +869,37 @@ class TestCFG:
         cfg = CFG.from_text("S -> a S b | a b epsilon")
         assert cfg.contains(["a", "b"])
 
+    def test_normal_form_is_cached(self):
+        cfg = CFG.from_text("S -> a S b | a b | A\nA -> c")
+        cnf = cfg.to_normal_form()
+        assert cfg.to_normal_form() is cnf
+        assert cnf.to_normal_form() is cnf
+        assert cnf.is_normal_form()
+
+    def test_normal_form_of_normal_form(self):
+        cfg = CFG.from_text("S -> A B | a\nA -> a\nB -> b")
+        assert cfg.to_normal_form() is cfg
+        var_s = Variable("S")
+        ter_a = Terminal("a")
+        cfg = CFG(start_symbol=var_s,
+                  productions=[Production(var_s, [ter_a]),
+                               Production(var_s, [ter_a])])
+        cnf = cfg.to_normal_form()
+        assert cnf is not cfg
+        assert len(cnf.productions) == 1
+
+    def test_get_productions_by_head(self):
+        cfg = CFG.from_text("S -> a S b | A\nA -> a")
+        productions_by_head = cfg.get_productions_by_head()
+        assert len(productions_by_head) == 2
+        assert len(productions_by_head[Variable("S")]) == 2
+        assert productions_by_head[Variable("A")] == \
+            [Production(Variable("A"), [Terminal("a")])]
+        productions_by_head[Variable("A")].clear()
+        del productions_by_head[Variable("S")]
+        assert len(cfg.get_productions_by_head()[Variable("S")]) == 2
+        assert len(cfg.get_productions_by_head()[Variable("A")]) == 1
+
 
 def get_example_text_duplicate():
     """ Duplicate text """
@@ -7,6 +7,7 @@ from os import path
 import pytest
 
 from pyformlang.cfg import CFG, Variable, Terminal, Epsilon
+from pyformlang.cfg.cfg import NotParsableException
 from pyformlang.cfg.llone_parser import LLOneParser
 from pyformlang.cfg.tests.test_cfg import get_example_text_duplicate
 from pyformlang.regular_expression import Regex
@@ -97,6 +98,25 @@ class TestLLOneParser:
         assert follow_set["C"] == \
                          {"$", Terminal("h"), Terminal("g"), Terminal("b")}
 
+    def test_sets_are_copies(self):
+        text = get_example_text_duplicate()
+        cfg = CFG.from_text(text, start_symbol="E")
+        llone_parser = LLOneParser(cfg)
+        first_set = llone_parser.get_first_set()
+        follow_set = llone_parser.get_follow_set()
+        parsing_table = llone_parser.get_llone_parsing_table()
+        assert llone_parser.get_first_set() == first_set
+        assert llone_parser.get_follow_set() == follow_set
+        assert llone_parser.get_llone_parsing_table() == parsing_table
+        # The sets and the table given are copies of the cached ones
+        first_set[Variable("E")].add(Terminal("z"))
+        follow_set[Variable("E")].clear()
+        parsing_table[Variable("E")].clear()
+        assert llone_parser.get_first_set() != first_set
+        assert llone_parser.get_follow_set() != follow_set
+        assert llone_parser.get_llone_parsing_table() != parsing_table
+        assert llone_parser.is_llone_parsable()
+
     def test_get_llone_table(self):
         # Example from:
         # https://www.geeksforgeeks.org/construction-of-ll1-parsing-table/
@@ -169,6 +189,12 @@ class TestLLOneParser:
         assert parse_tree.value == Variable("E")
         assert len(parse_tree.sons) == 2
 
+    def test_get_llone_parse_tree_too_long(self):
+        cfg = CFG.from_text("S -> a")
+        llone_parser = LLOneParser(cfg)
+        with pytest.raises(NotParsableException):
+            llone_parser.get_llone_parse_tree(["a", "a"])
+
     def test_get_llone_leftmost_derivation(self):
         text = get_example_text_duplicate()
         cfg = CFG.from_text(text, start_symbol="E")
@@ -1,6 +1,8 @@
 """ Tests the productions """
 
-from pyformlang.cfg import Production, Variable, Terminal
+import pytest
+
+from pyformlang.cfg import Production, Variable, Terminal, Epsilon
 
 
 class TestProduction:
@@ -26,3 +28,36 @@ class TestProduction:
         assert hash(prod0) != hash(prod3)
         assert hash(prod0) != hash(prod4)
         assert " -> " in str(prod0)
+
+    def test_unhashable_body(self):
+        prod0 = Production(Variable("S"), [Terminal(["x"])])
+        prod1 = Production(Variable("S"), [Terminal(["x"])])
+        assert prod0 == prod1
+        with pytest.raises(TypeError):
+            hash(prod0)
+        prod2 = Production(Variable("S"), [Terminal(("x",))])
+        assert prod0 != prod2
+        assert prod2 != prod0
+
+    def test_hash_depends_on_order(self):
+        prod0 = Production(Variable("S"), [Variable("A"), Variable("B")])
+        prod1 = Production(Variable("S"), [Variable("B"), Variable("A")])
+        assert prod0 != prod1
+        assert hash(prod0) != hash(prod1)
+        assert len({prod0, prod1}) == 2
+
+    def test_filtering(self):
+        body = [Variable("A"), Epsilon(), Terminal("b"), Epsilon()]
+        prod = Production(Variable("S"), body)
+        assert prod.body == [Variable("A"), Terminal("b")]
+        body = [Variable("A"), Terminal("b")]
+        prod = Production(Variable("S"), body)
+        assert prod.body == body
+        body.append(Epsilon())
+        assert len(prod.body) == 2
+
+    def test_repr(self):
+        prod = Production(Variable("S"), [Terminal("a"), Variable("B")])
+        assert repr(prod) == "S -> Terminal(a) B"
+        assert repr(prod) is repr(prod)
+        assert Variable("".join(["S", "0"])).value is Variable("S0").value
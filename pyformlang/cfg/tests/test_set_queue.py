@@ -0,0 +1,20 @@
+""" Tests the set queue """
+
+from pyformlang.cfg.set_queue import SetQueue
+
+
+class TestSetQueue:
+    """ Tests the set queue """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_order_and_duplicates(self):
+        queue = SetQueue()
+        queue.append(1)
+        queue.append(2)
+        queue.append(1)
+        assert queue.pop() == 1
+        queue.append(1)
+        assert queue.pop() == 2
+        assert queue.pop() == 1
+        assert not queue
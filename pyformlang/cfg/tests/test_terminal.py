@@ -1,5 +1,9 @@
 """ Tests the terminal """
+import copy
+import pickle
+
 from pyformlang.cfg import Terminal, Epsilon
+from pyformlang.cfg.utils import to_terminal_word
 
 
 class TestTerminal:
@@ -22,3 +26,41 @@ class TestTerminal:
         epsilon = Epsilon()
         assert epsilon.to_text() == "epsilon"
         assert Terminal("C").to_text() == '"TER:C"'
+
+    def test_interning(self):
+        assert Terminal("a") is Terminal("a")
+        assert Terminal(1) is not Terminal(True)
+        assert Terminal(1) is not Terminal("1")
+        assert Terminal(1) == Terminal(True)
+        assert Terminal(["a"]).value == ["a"]
+        terminal = Terminal("b")
+        assert copy.deepcopy(terminal) is terminal
+        assert pickle.loads(pickle.dumps(terminal)) is terminal
+
+    def test_interning_keeps_value(self):
+        terminal = Terminal((1,))
+        assert Terminal((True,)) is terminal
+        assert terminal.value == (1,)
+        assert terminal.value[0] is not True
+        assert terminal.to_text() == "(1,)"
+        terminal = Terminal(0.0)
+        assert Terminal(-0.0) is terminal
+        assert str(terminal.value) == "0.0"
+        assert terminal.to_text() == "0.0"
+
+    def test_epsilon_singleton(self):
+        assert Epsilon() is Epsilon()
+        assert Epsilon() == Epsilon()
+        assert Epsilon() != Terminal("epsilon")
+        assert Terminal("epsilon") != Epsilon()
+        assert copy.deepcopy(Epsilon()) is Epsilon()
+        assert pickle.loads(pickle.dumps(Epsilon())) is Epsilon()
+        assert Epsilon().value == "epsilon"
+
+    def test_to_terminal_word(self):
+        word = to_terminal_word(["a", Terminal("b"), Epsilon(), "a", 1, True])
+        assert word == [Terminal("a"), Terminal("b"), Terminal("a"),
+                        Terminal(1), Terminal(True)]
+        assert word[0] is word[2]
+        assert word[4].value is True
+        assert to_terminal_word([["a"]])[0].value == ["a"]
@@ -1,4 +1,6 @@
 """ Tests the variable """
+import pickle
+
 from pyformlang.cfg import Variable
 
 
@@ -19,3 +21,20 @@ class TestVariable:
         assert str(variable0) == str(variable2)
         assert str(variable0) == str(variable3)
         assert str(variable0) != str(variable1)
+
+    def test_pickle(self):
+        variable = Variable("A")
+        variable.index_cfg_converter = 2
+        assert not hasattr(variable, "__dict__")
+        unpickled = pickle.loads(pickle.dumps(variable))
+        assert unpickled == variable
+        assert unpickled.index_cfg_converter == 2
+
+    def test_str_subclass(self):
+        class Name(str):
+            """ A subclass of str, which cannot be interned """
+
+        variable = Variable(Name("A"))
+        assert isinstance(variable.value, Name)
+        assert variable == Variable("A")
+        assert variable.to_text() == "A"
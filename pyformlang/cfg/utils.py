@@ -1,7 +1,10 @@
 """ Useful functions """
 
+from typing import Any, Iterable, List
+
 from .variable import Variable
 from .terminal import Terminal
+from .epsilon import Epsilon
 
 
 def to_variable(given):
@@ -16,3 +19,31 @@ def to_terminal(given):
     if isinstance(given, Terminal):
         return given
     return Terminal(given)
+
+
+def to_terminal_word(word: Iterable[Any]) -> List[Terminal]:
+    """ Transformation of a word into terminals, without the epsilons """
+    # Words repeat their letters, so each distinct letter is converted
+    # once. The type is part of the key, as equal values of different
+    # types may not give the same terminal
+    converted = {}
+    terminals = []
+    for letter in word:
+        try:
+            terminal = converted[(type(letter), letter)]
+        except KeyError:
+            terminal = _to_terminal_or_none(letter)
+            converted[(type(letter), letter)] = terminal
+        except TypeError:
+            # Unhashable letters are converted each time
+            terminal = _to_terminal_or_none(letter)
+        if terminal is not None:
+            terminals.append(terminal)
+    return terminals
+
+
+def _to_terminal_or_none(given):
+    """ Transformation into a terminal, or None for epsilon """
+    if given == Epsilon():
+        return None
+    return to_terminal(given)
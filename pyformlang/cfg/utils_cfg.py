@@ -1,27 +1,32 @@
 """ Internal Usage only"""
 
 
-from typing import List, AbstractSet
+from typing import List, AbstractSet, Iterable, Dict
 
 from .production import Production
 from .epsilon import Epsilon
 from .cfg_object import CFGObject
+from .variable import Variable
 
 
 def remove_nullable_production_sub(body: List[CFGObject],
                                    nullables: AbstractSet[CFGObject]) \
         -> List[List[CFGObject]]:
-    """ Recursive sub function to remove nullable objects """
-    if not body:
-        return [[]]
-    all_next = remove_nullable_production_sub(body[1:], nullables)
-    res = []
-    for body_temp in all_next:
-        if body[0] in nullables:
-            res.append(body_temp)
-        if body[0] != Epsilon():
-            res.append([body[0]] + body_temp.copy())
-    return res
+    """ Sub function giving the bodies without some nullable objects """
+    # The bodies are built from the end of the body, one component at a
+    # time, in the same order as a recursion on the tail would give them
+    bodies = [[]]
+    for body_component in reversed(body):
+        is_nullable = body_component in nullables
+        is_kept = body_component != Epsilon()
+        new_bodies = []
+        for body_temp in bodies:
+            if is_nullable:
+                new_bodies.append(body_temp)
+            if is_kept:
+                new_bodies.append([body_component] + body_temp)
+        bodies = new_bodies
+    return bodies
 
 
 def remove_nullable_production(production: Production,
@@ -36,7 +41,8 @@ def remove_nullable_production(production: Production,
     return res
 
 
-def get_productions_d(productions):
+def get_productions_d(productions: Iterable[Production]) \
+        -> Dict[Variable, List[Production]]:
     """ Get productions as a dictionary """
     productions_d = {}
     for production in productions:
@@ -13,12 +13,18 @@ class Variable(CFGObject):  # pylint: disable=too-few-public-methods
         The value of the variable
     """
 
+    __slots__ = ["index_cfg_converter"]
+
+    # Tag used to dispatch on the kind of symbol without isinstance
+    kind = "V"
+
     def __init__(self, value):
         super().__init__(value)
-        self._hash = None
         self.index_cfg_converter = None
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, CFGObject):
             return self._value == other.value
         return self._value == other
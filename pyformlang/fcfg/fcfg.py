@@ -1,11 +1,12 @@
 """Feature Context-Free Grammar"""
-import string
 from typing import Iterable, AbstractSet, Union
 
-from pyformlang.cfg import CFG, Terminal, Epsilon, Variable
-from pyformlang.cfg.cfg import is_special_text, EPSILON_SYMBOLS, NotParsableException
+from pyformlang.cfg import CFG, Terminal, Variable
+from pyformlang.cfg.cfg import (is_special_text, EPSILON_TEXTS,
+                                VARIABLE_FIRST_CHARACTERS,
+                                NotParsableException)
 from pyformlang.cfg.parse_tree import ParseTree
-from pyformlang.cfg.utils import to_terminal
+from pyformlang.cfg.utils import to_terminal_word
 from pyformlang.fcfg.feature_production import FeatureProduction
 from pyformlang.fcfg.feature_structure import FeatureStructure, FeatureStructuresNotCompatibleException
 from pyformlang.fcfg.state import State, StateProcessed
@@ -61,17 +62,23 @@ class FCFG(CFG):
                  productions: Iterable[FeatureProduction] = None):
         super().__init__(variables, terminals, start_symbol, productions)
 
-    def __predictor(self, state, chart, processed):
+    @staticmethod
+    def __predictor(state, chart, processed, productions_d, predicted):
         # We have an incomplete state and the next token is a variable
         # We must ask to process the variable with another rule
         end_idx = state.positions[1]
         next_var = state.production.body[state.positions[2]]
-        for production in self.productions:
-            if production.head == next_var:
-                new_state = State(production, (end_idx, end_idx, 0),
-                                  production.features, ParseTree(production.head))
-                if processed.add(end_idx, new_state):
-                    chart[end_idx].append(new_state)
+        # The predicted states only depend on the variable and the position,
+        # so they are generated once per pair
+        predicted_positions = predicted.setdefault(next_var, set())
+        if end_idx in predicted_positions:
+            return
+        predicted_positions.add(end_idx)
+        for production in productions_d.get(next_var, []):
+            new_state = State(production, (end_idx, end_idx, 0),
+                              production.features, ParseTree(production.head))
+            if processed.add(end_idx, new_state):
+                chart[end_idx].append(new_state)
 
     def contains(self, word: Iterable[Union[Terminal, str]]) -> bool:
         """ Gives the membership of a word to the grammar
@@ -112,7 +119,7 @@ class FCFG(CFG):
         return final_state.parse_tree
 
     def _get_final_state(self, word: Iterable[Terminal]):
-        word = [to_terminal(x) for x in word if x != Epsilon()]
+        word = to_terminal_word(word)
         chart = [[] for _ in range(len(word) + 1)]
         # Processed[i] contains all production rule that are currently working until i.
         processed = StateProcessed(len(word) + 1)
@@ -122,11 +129,15 @@ class FCFG(CFG):
         first_state = State(dummy_rule, (0, 0, 0), dummy_rule.features, ParseTree("BEGIN"))
         chart[0].append(first_state)
         processed.add(0, first_state)
+        productions_d = self._get_productions_by_head()
+        # Variable to the positions where it was already predicted
+        predicted = {}
         for i in range(len(chart) - 1):
             while chart[i]:
                 state = chart[i].pop()
                 if state.is_incomplete() and state.next_is_variable():
-                    self.__predictor(state, chart, processed)
+                    self.__predictor(state, chart, processed, productions_d,
+                                     predicted)
                 elif state.is_incomplete():
                     if state.next_is_word(word[i]):
                         _scanner(state, chart, processed)
@@ -150,8 +161,7 @@ class FCFG(CFG):
             head_text = head_text[5:-1]
         head_text, head_conditions = _split_text_conditions(head_text)
         head_fs = FeatureStructure.from_text(head_conditions, structure_variables)
-        head = Variable(head_text)
-        variables.add(head)
+        head = cls._get_variable_by_name(head_text, variables)
         all_body_fs = []
         for sub_body in body_s.split("|"):
             body = []
@@ -161,15 +171,13 @@ class FCFG(CFG):
                     body_component = body_component[5:-1]
                 else:
                     type_component = ""
-                if body_component[0] in string.ascii_uppercase or \
+                if body_component[0] in VARIABLE_FIRST_CHARACTERS or \
                         type_component == "VAR":
                     body_component, body_conditions = _split_text_conditions(body_component)
                     body_fs = FeatureStructure.from_text(body_conditions, structure_variables)
                     all_body_fs.append(body_fs)
-                    body_var = Variable(body_component)
-                    variables.add(body_var)
-                    body.append(body_var)
-                elif body_component not in EPSILON_SYMBOLS or type_component \
+                    body.append(cls._get_variable_by_name(body_component, variables))
+                elif body_component not in EPSILON_TEXTS or type_component \
                         == "TER":
                     body_ter = Terminal(body_component)
                     terminals.add(body_ter)
@@ -205,7 +213,7 @@ def _completer(state, chart, processed):
     head = state.production.head
     for next_state in processed.generator(begin_idx):
         # next_state[1][1] == begin_idx always true
-        if next_state.is_incomplete() and next_state.production.body[next_state.positions[2]] == head:
+        if next_state.is_incomplete() and next_state.next_is_word(head):
             try:
                 copy_left = state.feature_stucture.copy()
                 copy_left = copy_left.get_feature_by_path(["head"])
@@ -212,6 +212,31 @@ class FeatureStructure:
                 return False
         return True
 
+    def get_signature(self):
+        """ Get the paths of the feature structure with their values.
+
+        A feature structure subsumes another one exactly when its signature
+        is included in the signature of the other one.
+
+        Returns
+        --------
+        signature : frozenset of (tuple of str, Any)
+            The pairs of paths and values, or None if a value is not hashable.
+
+        """
+        signature = set()
+        to_process = [((), self)]
+        try:
+            while to_process:
+                path, current = to_process.pop()
+                current = current.get_dereferenced()
+                signature.add((path, current.value))
+                for feature, content in current.content.items():
+                    to_process.append((path + (feature,), content))
+        except TypeError:
+            return None
+        return frozenset(signature)
+
     def get_all_paths(self):
         """ Get the list of all path in the feature structure
 
@@ -1,4 +1,5 @@
 """Internal usage states"""
+from collections import defaultdict
 from typing import Tuple
 
 from pyformlang.cfg import Variable
@@ -10,6 +11,9 @@ from pyformlang.fcfg.feature_structure import FeatureStructure
 class State:
     """For internal usage"""
 
+    __slots__ = ["production", "positions", "feature_stucture", "parse_tree",
+                 "_key", "_next_symbol"]
+
     def __init__(self,
                  production: FeatureProduction,
                  positions: Tuple[int, int, int],
@@ -19,43 +23,86 @@ class State:
         self.positions = positions
         self.feature_stucture = feature_stucture
         self.parse_tree = parse_tree
+        # The states are not modified, so what is asked about them is
+        # computed once
+        self._key = (production, positions)
+        # The symbol after the dot, None when the state is complete
+        if positions[2] < len(production.body):
+            self._next_symbol = production.body[positions[2]]
+        else:
+            self._next_symbol = None
 
     def get_key(self):
         """Get the key of the state"""
-        return self.production, self.positions
+        return self._key
 
     def is_incomplete(self):
         """Check if a state is incomplete"""
-        return self.positions[2] < len(self.production.body)
+        return self._next_symbol is not None
 
     def next_is_variable(self):
         """Check if the next symbol to process is a variable"""
-        return isinstance(self.production.body[self.positions[2]], Variable)
+        return isinstance(self._next_symbol, Variable)
 
     def next_is_word(self, word):
         """Check if the next symbol matches a given word"""
-        return self.production.body[self.positions[2]] == word
+        return self._next_symbol == word
 
 
 class StateProcessed:
     """For internal usage"""
 
-    def __init__(self, size: int):
-        self.processed = [{} for _ in range(size)]
+    def __init__(self, size: int):  # pylint: disable=unused-argument
+        # The keys of the states are hashed once, to get an integer id
+        # which indexes the states at each position
+        self._key_ids = {}
+        # The positions are only allocated once a state reaches them, most
+        # of them staying empty on long words
+        self.processed = defaultdict(dict)
+        # The signatures of the feature structures of the processed states,
+        # None standing for the structures which have no signature
+        self._signatures = defaultdict(dict)
+        # The feature structures of the states are not modified once
+        # processed, and are often shared, so their signature is kept
+        self._known_signatures = {}
 
     def add(self, i: int, element: State):
         """Add a state to the processed states. Returns if the insertion was successful or not."""
-        key = element.get_key()
-        if key not in self.processed[i]:
-            self.processed[i][key] = []
-        for other in self.processed[i][key]:
-            if other.feature_stucture.subsumes(element.feature_stucture):
-                return False
-        self.processed[i][key].append(element)
+        key = self._key_ids.setdefault(element.get_key(), len(self._key_ids))
+        states = self.processed[i].setdefault(key, [])
+        if not states:
+            # Most keys have a single state, which needs no signature
+            states.append(element)
+            return True
+        signatures = self._signatures[i].get(key)
+        if signatures is None:
+            signatures = {self._get_signature(states[0].feature_stucture):
+                          None}
+            self._signatures[i][key] = signatures
+        signature = self._get_signature(element.feature_stucture)
+        if signature is None or None in signatures:
+            for other in states:
+                if other.feature_stucture.subsumes(element.feature_stucture):
+                    return False
+        elif signature in signatures:
+            # The same structure was already processed
+            return False
+        else:
+            for other_signature in signatures:
+                if other_signature <= signature:
+                    return False
+        states.append(element)
+        signatures[signature] = None
         return True
 
+    def _get_signature(self, feature_structure):
+        if feature_structure not in self._known_signatures:
+            self._known_signatures[feature_structure] = \
+                feature_structure.get_signature()
+        return self._known_signatures[feature_structure]
+
     def generator(self, i: int):
         """Generates a collection of all the states at a given position"""
-        for states in self.processed[i].values():
+        for states in self.processed.get(i, {}).values():
             for state in states:
                 yield state
@@ -185,8 +185,11 @@ class TestFCFG:
         state0 = State(FeatureProduction(Variable("S"), [], fs1, []), (0, 0, 0), fs1, ParseTree("S"))
         processed = StateProcessed(1)
         state1 = State(FeatureProduction(Variable("S"), [], fs1, []), (0, 0, 0), fs1, ParseTree("S"))
+        assert not list(processed.generator(0))
         assert processed.add(0, state0)
         assert not processed.add(0, state1)
+        assert list(processed.generator(0)) == [state0]
+        assert not list(processed.generator(1))
 
     def test_from_text(self):
         """Test containment from a text description"""
@@ -158,6 +158,19 @@ class TestFeatureStructure:
         assert not fs5.subsumes(fs3)
         assert not fs5.subsumes(fs4)
 
+    def test_signature(self):
+        """Test the signatures agree with the subsumption"""
+        structures = [FeatureStructure.from_text(text) for text in
+                      ["", "NUMBER=sg", "NUMBER=pl", "PERSON=3",
+                       "NUMBER=sg, PERSON=3", "AGR=[NUMBER=sg]",
+                       "AGR=[NUMBER=sg, PERSON=3], SUBJ=[AGR=[NUMBER=sg]]"]]
+        structures.append(_get_agreement_subject_number_person())
+        for first in structures:
+            for second in structures:
+                assert first.subsumes(second) == \
+                    (first.get_signature() <= second.get_signature())
+        assert FeatureStructure([]).get_signature() is None
+
     def test_copy(self):
         """Test to subsume"""
         fs1 = FeatureStructure()
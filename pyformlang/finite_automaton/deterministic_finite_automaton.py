@@ -19,33 +19,31 @@ from .transition_function import TransitionFunction
 
 
 class PreviousTransitions:
-    """For internal usage"""
-
-    def __init__(self, states, symbols):
-        self._to_index_state = {}
-        self._to_index_state[None] = 0
-        for i, state in enumerate(states):
-            self._to_index_state[state] = i + 1
-        self._to_index_symbol = {}
-        for i, symbol in enumerate(symbols):
-            self._to_index_symbol[symbol] = i
-        self._conversion = np.empty((len(states) + 1, len(symbols)),
-                                    dtype=object)
-
-    def add(self, next0, symbol, state):
-        """ Internal """
-        i_next0 = self._to_index_state[next0]
-        i_symbol = self._to_index_symbol[symbol]
-        if self._conversion[i_next0, i_symbol] is None:
-            self._conversion[i_next0, i_symbol] = [state]
-        else:
-            self._conversion[i_next0, i_symbol].append(state)
+    """For internal usage
+
+    The states and the symbols are given as indexes. The transitions are \
+    the ones of a complete automaton, heads[i_state * n_symbols + i_symbol] \
+    being the next state of a state by a symbol.
+    """
+
+    def __init__(self, heads, n_symbols):
+        self._n_symbols = n_symbols
+        cells = heads * n_symbols + np.arange(len(heads)) % max(n_symbols, 1)
+        # The previous states grouped by next state and symbol, the previous
+        # state of a transition being its index divided by n_symbols
+        self._data = np.argsort(cells, kind="stable") // max(n_symbols, 1)
+        self._bounds = np.concatenate(
+            ([0], np.cumsum(np.bincount(cells, minlength=len(heads)))))
 
-    def get(self, next0, symbol):
+    def get(self, i_next0, i_symbol):
         """ Internal """
-        i_next0 = self._to_index_state[next0]
-        i_symbol = self._to_index_symbol[symbol]
-        return self._conversion[i_next0, i_symbol] or []
+        cell = i_next0 * self._n_symbols + i_symbol
+        return self._data[self._bounds[cell]:self._bounds[cell + 1]]
+
+    def get_by_indexes(self, next_indexes, i_symbol):
+        """ Gives the previous states of several states """
+        return _gather_groups(next_indexes * self._n_symbols + i_symbol,
+                              self._data, self._bounds)
 
 
 class DeterministicFiniteAutomaton(NondeterministicFiniteAutomaton):
@@ -284,30 +282,28 @@ class DeterministicFiniteAutomaton(NondeterministicFiniteAutomaton):
                     dfa.add_transition(state, symbol, state_to)
         return dfa
 
-    def _get_previous_transitions(self):
-        previous_transitions = PreviousTransitions(self._states,
-                                                   self._input_symbols)
-        for state in self._states:
-            for symbol in self._input_symbols:
-                next0 = self._transition_function(state, symbol)
-                if next0:
-                    next0 = next0[0]
-                else:
-                    next0 = None
-                previous_transitions.add(next0, symbol, state)
-        for symbol in self._input_symbols:
-            previous_transitions.add(None, symbol, None)
-        return previous_transitions
-
-    def minimize(self) -> "DeterministicFiniteAutomaton":
+    def minimize(self, algorithm: str = "valmari") \
+            -> "DeterministicFiniteAutomaton":
         """ Minimize the current DFA
 
+        Parameters
+        ----------
+        algorithm : str, optional
+            The algorithm grouping the equivalent states, either "valmari" \
+            for the algorithm of Valmari and Lehtinen, the default, or \
+            "hopcroft" for the algorithm of Hopcroft
+
         Returns
         ----------
         dfa :  :class:`~pyformlang.deterministic_finite_automaton\
         .DeterministicFiniteAutomaton`
             The minimal DFA
 
+        Raises
+        ----------
+        ValueError
+            When the algorithm is unknown
+
         Examples
         --------
 
@@ -328,8 +324,7 @@ class DeterministicFiniteAutomaton(NondeterministicFiniteAutomaton):
         reachables = self._get_reachable_states()
         states = self._states.intersection(reachables)
         # Group the equivalent states
-        partition = self._get_partition()
-        groups = partition.get_groups()
+        groups = self._get_groups(algorithm)
         # Create a state for this
         to_new_states = {}
         for group in groups:
@@ -354,46 +349,107 @@ class DeterministicFiniteAutomaton(NondeterministicFiniteAutomaton):
                             done.add((next_node, symbol))
         return dfa
 
+    def _get_groups(self, algorithm):
+        """ Gives the groups of equivalent states """
+        if algorithm == "valmari":
+            return self._get_partition_valmari()
+        if algorithm == "hopcroft":
+            return self._get_partition()
+        raise ValueError("Unknown minimization algorithm: " + algorithm)
+
     def _get_partition(self):
-        previous_transitions = self._get_previous_transitions()
-        finals = []
-        non_finals = []
-        for state in self._states:
-            if state in self._final_states:
-                finals.append(state)
-            else:
-                non_finals.append(state)
-        # None is the trash node
-        non_finals.append(None)
-        # + 1 for trash node
-        partition = Partition(len(self._states) + 1)
+        from_index, to_index = self._get_state_indexes()
+        n_symbols = len(self._input_symbols)
+        previous_transitions = PreviousTransitions(
+            self._get_transition_heads(to_index), n_symbols)
+        finals = [to_index[state] for state in self._final_states]
+        non_finals = [i for i, state in enumerate(from_index)
+                      if state not in self._final_states]
+        partition = Partition(len(from_index))
         partition.add_class(finals)
         partition.add_class(non_finals)
-        # + 1 for trash node
-        processing_list = HopcroftProcessingList(len(self._states) + 1,
-                                                 self._input_symbols)
+        processing_list = HopcroftProcessingList(len(from_index),
+                                                 range(n_symbols))
         to_add = 0  # 0 is the index of finals, 1 of non_finals
         if len(non_finals) < len(finals):
             to_add = 1
-        for symbol in self._input_symbols:
-            processing_list.insert(to_add, symbol)
+        for i_symbol in range(n_symbols):
+            processing_list.insert(to_add, i_symbol)
         while not processing_list.is_empty():
             current_class, current_symbol = processing_list.pop()
-            inverse = []
-            for element in partition.part[current_class]:
-                inverse += previous_transitions.get(element.value,
-                                                    current_symbol)
-            for valid_set in partition.get_valid_sets(inverse):
-                new_class = partition.split(valid_set, inverse)
-                for symbol in self._input_symbols:
-                    if processing_list.contains(valid_set, symbol):
-                        processing_list.insert(new_class, symbol)
-                    elif (len(partition.part[valid_set]) <
-                          len(partition.part[valid_set])):
-                        processing_list.insert(valid_set, symbol)
-                    else:
-                        processing_list.insert(new_class, symbol)
-        return partition
+            inverse = previous_transitions.get_by_indexes(
+                partition.get_class(current_class), current_symbol)
+            self._split_partition(partition, processing_list, inverse)
+        return [[from_index[element] for element in group]
+                for group in partition.get_groups()]
+
+    def _split_partition(self, partition, processing_list, inverse):
+        for valid_set, new_class in partition.split(inverse):
+            for i_symbol in range(len(self._input_symbols)):
+                if processing_list.contains(valid_set, i_symbol):
+                    processing_list.insert(new_class, i_symbol)
+                elif (partition.get_size(valid_set) <
+                      partition.get_size(new_class)):
+                    processing_list.insert(valid_set, i_symbol)
+                else:
+                    processing_list.insert(new_class, i_symbol)
+
+    def _get_partition_valmari(self):
+        # Algorithm from:
+        # Valmari, A., & Lehtinen, P. (2008). Efficient minimization of DFAs
+        # with partial transition functions.
+        # The transition of the state of index i by the symbol of index j has
+        # the index i * n_symbols + j
+        from_index, to_index = self._get_state_indexes()
+        n_symbols = len(self._input_symbols)
+        heads = self._get_transition_heads(to_index)
+        # The transitions grouped by head
+        incoming = np.argsort(heads, kind="stable")
+        incoming_bounds = np.concatenate(
+            ([0], np.cumsum(np.bincount(heads, minlength=len(from_index)))))
+        # The blocks are the classes of states, the smaller class being
+        # processed first
+        finals = [to_index[state] for state in self._final_states]
+        non_finals = [i for i, state in enumerate(from_index)
+                      if state not in self._final_states]
+        blocks = Partition(len(from_index))
+        blocks.add_class(max(finals, non_finals, key=len))
+        blocks.add_class(min(non_finals, finals, key=len))
+        # The cords are the classes of transitions, first grouped by symbol
+        cords = Partition(len(heads))
+        for i_symbol in range(n_symbols):
+            cords.add_class(range(i_symbol, len(heads), n_symbols))
+        i_block, i_cord = 1, 0
+        while i_cord < len(cords):
+            # Splits the blocks on the tails of the transitions of the cord
+            blocks.refine(cords.get_class(i_cord) // n_symbols)
+            i_cord += 1
+            while i_block < len(blocks):
+                # Splits the cords on the transitions going to the block
+                cords.refine(_gather_groups(
+                    blocks.get_class(i_block), incoming, incoming_bounds))
+                i_block += 1
+        return [[from_index[element] for element in group]
+                for group in blocks.get_groups()]
+
+    def _get_state_indexes(self):
+        """ Gives the states by index and the index of each state, the \
+        trash node None having the index 0 """
+        from_index = [None] + list(self._states)
+        return from_index, {state: i for i, state in enumerate(from_index)}
+
+    def _get_transition_heads(self, to_index):
+        """ Gives the index of the head of each transition of the completed \
+        automaton """
+        symbols = list(self._input_symbols)
+        heads = np.zeros(len(to_index) * len(symbols), dtype=np.int64)
+        for state in self._states:
+            for i_symbol, symbol in enumerate(symbols):
+                next_states = self._transition_function(state, symbol)
+                if next_states:
+                    heads[to_index[state] * len(symbols) + i_symbol] = \
+                        to_index[next_states[0]]
+        return heads
 
     def is_equivalent_to(self, other):
         """ Check whether two automata are equivalent
@@ -466,3 +522,15 @@ class DeterministicFiniteAutomaton(NondeterministicFiniteAutomaton):
                     matches[next_state_self] = next_state_other
                     to_process.append((next_state_self, next_state_other))
         return True
+
+
+def _gather_groups(keys, data, bounds):
+    """ Gives the concatenated groups of some keys, the group of a key \
+    being data[bounds[key]:bounds[key + 1]] """
+    if len(keys) == 1:
+        return data[bounds[keys[0]]:bounds[keys[0] + 1]]
+    starts = bounds[keys]
+    lengths = bounds[keys + 1] - starts
+    # The positions of the elements of each group follow its start
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return data[offsets + np.arange(len(offsets))]
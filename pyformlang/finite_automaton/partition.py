@@ -2,55 +2,115 @@
 For internal usage.
 """
 
-from .doubly_linked_list import DoublyLinkedList
+import numpy as np
 
 
 class Partition:
-    """Class to manage partitions used in Hopcroft minimization algorithm"""
+    """Class to manage partitions used in Hopcroft minimization algorithm
+
+    The elements are the integers from 0 to n_states - 1. They are stored \
+    in a single array where the elements of a class are contiguous, so that \
+    a class is split by moving elements to its beginning.
+    """
 
     def __init__(self, n_states):
-        self._class_names = {}  # States to class index
-        # Class idx to states
-        self.part = [DoublyLinkedList() for _ in range(n_states)]
-        self._place = {}  # state to position in list
+        # The elements, grouped by class
+        self._elements = np.zeros(n_states, dtype=np.int64)
+        # The position of each element in the elements
+        self._location = np.zeros(n_states, dtype=np.int64)
+        # The class of each element
+        self._class_names = np.zeros(n_states, dtype=np.int64)
+        # Class idx to the bounds of its elements
+        self._begin = np.zeros(n_states, dtype=np.int64)
+        self._end = np.zeros(n_states, dtype=np.int64)
         self._counter = 0  # Number of classes
+        # Marks the elements being moved to a new class
+        self._marked = np.zeros(n_states, dtype=bool)
 
     def add_class(self, new_class):
         """Adds a new class"""
-        index = self._counter
+        new_class = np.fromiter(new_class, dtype=np.int64)
+        begin = self._end[self._counter - 1] if self._counter else 0
+        end = begin + len(new_class)
+        self._elements[begin:end] = new_class
+        self._location[new_class] = np.arange(begin, end)
+        self._class_names[new_class] = self._counter
+        self._begin[self._counter] = begin
+        self._end[self._counter] = end
         self._counter += 1
-        for element in new_class:
-            self._class_names[element] = index
-            node = self.part[index].append(element)
-            self._place[element] = node
 
     def move_to_new_class(self, elements_to_move):
-        """Move elements to a new class"""
-        for element in elements_to_move:
-            place = self._place[element]
-            place.delete()
-        self.add_class(elements_to_move)
-
-    def get_valid_sets(self, inverse):
-        """Get the valid sets"""
-        class_names = [0] * self._counter
-        for element in inverse:
-            class_names[self._class_names[element]] += 1
-        return [i for i, value in enumerate(class_names)
-                if value != 0 and value != len(self.part[i])]
-
-    def split(self, to_split, splitter):
-        """ Splits """
-        elements_to_move = []
-        for element in splitter:
-            if self._class_names[element] == to_split:
-                elements_to_move.append(element)
-        self.move_to_new_class(elements_to_move)
-        return self._counter - 1
+        """Move elements of a same class to a new class"""
+        elements_to_move = np.asarray(elements_to_move, dtype=np.int64)
+        class_name = self._class_names[elements_to_move[0]]
+        begin = self._begin[class_name]
+        middle = begin + len(elements_to_move)
+        # The elements to move which are not at the beginning of the class
+        # are swapped with the ones which stay
+        self._marked[elements_to_move] = True
+        front = self._elements[begin:middle]
+        staying = front[~self._marked[front]]
+        outside = elements_to_move[self._location[elements_to_move] >= middle]
+        holes = self._location[outside]
+        self._elements[holes] = staying
+        self._location[staying] = holes
+        self._elements[begin:middle] = elements_to_move
+        self._location[elements_to_move] = np.arange(begin, middle)
+        self._marked[elements_to_move] = False
+        # The beginning of the class becomes the new class
+        self._class_names[elements_to_move] = self._counter
+        self._begin[self._counter] = begin
+        self._end[self._counter] = middle
+        self._counter += 1
+        self._begin[class_name] = middle
+
+    def _get_parts(self, splitter):
+        """ Groups the elements of a splitter by class, in one pass """
+        if len(splitter) <= 1:
+            # Small splitters are frequent and need no sorting
+            return [splitter] if len(splitter) else []
+        class_names = self._class_names[splitter]
+        order = np.argsort(class_names, kind="stable")
+        bounds = np.flatnonzero(np.diff(class_names[order])) + 1
+        return np.split(splitter[order], bounds)
+
+    def split(self, splitter):
+        """ Splits the classes met by a splitter, its elements being moved \
+        to new classes. Returns the pairs of split and new classes. """
+        split_classes = []
+        for part in self._get_parts(splitter):
+            class_name = int(self._class_names[part[0]])
+            if len(part) != self.get_size(class_name):
+                self.move_to_new_class(part)
+                split_classes.append((class_name, self._counter - 1))
+        return split_classes
+
+    def refine(self, splitter):
+        """Splits all the classes on a set of elements, the smaller part \
+        of each split class becoming a new class"""
+        for part in self._get_parts(splitter):
+            class_name = self._class_names[part[0]]
+            size = self.get_size(class_name)
+            if len(part) == size:
+                continue
+            if 2 * len(part) > size:
+                class_elements = self.get_class(class_name)
+                self._marked[part] = True
+                part = class_elements[~self._marked[class_elements]]
+                self._marked[class_elements] = False
+            self.move_to_new_class(part)
+
+    def get_class(self, class_name):
+        """ Get the elements of a class """
+        return self._elements[self._begin[class_name]:self._end[class_name]]
+
+    def get_size(self, class_name):
+        """ Get the number of elements of a class """
+        return int(self._end[class_name] - self._begin[class_name])
+
+    def __len__(self):
+        return self._counter
 
     def get_groups(self):
         """ Get the groups """
-        res = []
-        for i in range(self._counter):
-            res.append([x.value for x in self.part[i]])
-        return res
+        return [self.get_class(i).tolist() for i in range(self._counter)]
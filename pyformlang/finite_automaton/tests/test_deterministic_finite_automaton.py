@@ -226,6 +226,23 @@ class TestDeterministicFiniteAutomaton:
         dfa = dfa.minimize()
         assert dfa.accepts([symb_a, symb_star, symb_a])
 
+    def test_minimize_algorithms(self):
+        dfa = DeterministicFiniteAutomaton()
+        dfa.add_transitions([(0, "a", 1), (1, "a", 2), (2, "a", 3),
+                             (3, "a", 0), (0, "b", 2), (2, "b", 0),
+                             (1, "b", 3), (3, "b", 1), (4, "a", 5)])
+        dfa.add_start_state(0)
+        dfa.add_final_state(1)
+        dfa.add_final_state(3)
+        dfa.add_final_state(5)
+        valmari = dfa.minimize()
+        hopcroft = dfa.minimize(algorithm="hopcroft")
+        assert len(valmari.states) == len(hopcroft.states) == 2
+        assert valmari.states == hopcroft.states
+        assert valmari.is_equivalent_to(dfa)
+        with pytest.raises(ValueError):
+            dfa.minimize(algorithm="brzozowski")
+
     def test_not_cyclic(self):
         dfa = DeterministicFiniteAutomaton()
         state0 = State(0)
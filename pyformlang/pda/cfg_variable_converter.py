@@ -20,9 +20,11 @@ class CFGVariableConverter:
             self._inverse_stack_symbol_d[symbol] = self._counter_symbol
             symbol.index_cfg_converter = self._counter_symbol
         self._counter_symbol += 1
-        self._conversions = [[[(False, None) for _ in range(len(states))]
-                              for _ in range(len(stack_symbols))] for _ in
-                             range(len(states))]
+        # Only the conversions which are used are stored, under the indexes
+        # of (state0, stack_symbol, state1), which keeps apart the states
+        # and the stack symbols met after the construction
+        self._valid = set()
+        self._variables = {}
 
     def _get_state_index(self, state):
         """Get the state index"""
@@ -52,49 +54,39 @@ class CFGVariableConverter:
 
     def to_cfg_combined_variable(self, state0, stack_symbol, state1):
         """ Conversion used in the to_pda method """
-        i_stack_symbol, i_state0, i_state1 = self._get_indexes(
-            stack_symbol, state0, state1)
-        prev = self._conversions[i_state0][i_stack_symbol][i_state1]
-        if prev[1] is None:
-            return self._create_new_variable(
-                i_stack_symbol, i_state0, i_state1, prev)[1]
-        return prev[1]
+        index = self._get_conversion_index(stack_symbol, state0, state1)
+        variable = self._variables.get(index)
+        if variable is None:
+            return self._create_new_variable(index)
+        return variable
 
-    def _create_new_variable(self,
-                             i_stack_symbol,
-                             i_state0,
-                             i_state1,
-                             prev,
-                             value=None):
-        # pylint: disable=too-many-arguments
+    def _create_new_variable(self, index, value=None):
         if value is None:
             value = self._counter
-        temp = (prev[0], cfg.Variable(value))
+        variable = cfg.Variable(value)
         self._counter += 1
-        self._conversions[i_state0][i_stack_symbol][i_state1] = temp
-        return temp
+        self._variables[index] = variable
+        return variable
 
     def set_valid(self, state0, stack_symbol, state1):
         """Set valid"""
-        i_stack_symbol, i_state0, i_state1 = self._get_indexes(
-            stack_symbol, state0, state1)
-        prev = self._conversions[i_state0][i_stack_symbol][i_state1]
-        self._conversions[i_state0][i_stack_symbol][i_state1] = (True, prev[1])
+        index = self._get_conversion_index(stack_symbol, state0, state1)
+        self._valid.add(index)
 
     def is_valid_and_get(self, state0, stack_symbol, state1):
         """Check if valid and get"""
-        i_state0 = self._get_state_index(state0)
-        i_stack_symbol = self._get_symbol_index(stack_symbol)
-        i_state1 = self._get_state_index(state1)
-        current = self._conversions[i_state0][i_stack_symbol][i_state1]
-        if not current[0]:
+        index = self._get_conversion_index(stack_symbol, state0, state1)
+        if index not in self._valid:
             return None
-        if current[1] is None:
-            return self._create_new_variable(i_stack_symbol,
-                                             i_state0,
-                                             i_state1,
-                                             current)[1]
-        return current[1]
+        variable = self._variables.get(index)
+        if variable is None:
+            return self._create_new_variable(index)
+        return variable
+
+    def _get_conversion_index(self, stack_symbol, state0, state1):
+        i_stack_symbol, i_state0, i_state1 = self._get_indexes(
+            stack_symbol, state0, state1)
+        return i_state0, i_stack_symbol, i_state1
 
     def _get_indexes(self, stack_symbol, state0, state1):
         i_state0 = self._get_state_index(state0)
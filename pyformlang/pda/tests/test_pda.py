@@ -5,6 +5,7 @@ from pyformlang.pda import PDA, State, StackSymbol, Symbol, Epsilon
 from pyformlang.cfg import Terminal
 from pyformlang import finite_automaton
 from pyformlang.pda.utils import PDAObjectCreator
+from pyformlang.pda.cfg_variable_converter import CFGVariableConverter
 from pyformlang.regular_expression import Regex
 
 
@@ -358,3 +359,22 @@ class TestPDA:
         pda_networkx.write_as_dot("pda.dot")
         assert cfg.contains(["0", "1"])
         assert path.exists("pda.dot")
+
+    def test_cfg_variable_converter_new_states(self):
+        """ Tests the conversions of states given after the construction """
+        state_a = State("a")
+        state_b = State("b")
+        stack_symbol = StackSymbol("Z")
+        converter = CFGVariableConverter([state_a], [stack_symbol])
+        variable0 = converter.to_cfg_combined_variable(
+            state_a, stack_symbol, state_b)
+        variable1 = converter.to_cfg_combined_variable(
+            state_b, stack_symbol, state_a)
+        assert variable0 is not variable1
+        assert variable0 is converter.to_cfg_combined_variable(
+            state_a, stack_symbol, state_b)
+        converter.set_valid(state_b, stack_symbol, state_a)
+        assert converter.is_valid_and_get(
+            state_a, stack_symbol, state_b) is None
+        assert converter.is_valid_and_get(
+            state_b, stack_symbol, state_a) is variable1